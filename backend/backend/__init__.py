@@ -1,3 +1,32 @@
-from .filemaker import FileMaker, Config
+import importlib
 
-__all__ = ['FileMaker', 'Config']
+# Public name -> submodule that defines it. Submodules are only imported the
+# first time one of their names is used, so a tool pays for what it touches.
+_EXPORTS: dict = {
+    'FileMaker': 'filemaker', 'Config': 'filemaker',
+    'AsyncFileMaker': 'aio', 'FileResult': 'aio',
+    'read_manifest': 'manifest', 'iter_names': 'manifest',
+    'Journal': 'journal', 'MediaIndex': 'mediaindex',
+    'Template': 'templates', 'TemplateRegistry': 'templates',
+    'TEMPLATES': 'templates', 'PROFILES': 'templates',
+    'clone_file': 'fsutil', 'clone_tree': 'fsutil', 'cache_dir': 'fsutil',
+    'remove_tree': 'fsutil', 'move_to_trash': 'fsutil', 'exchange': 'fsutil',
+    'fsync_path': 'fsutil', 'fsync_tree': 'fsutil', 'scan_tree': 'fsutil',
+    'walk_parallel': 'fsutil', 'which': 'fsutil',
+    'extract_declarations': 'cparse', 'DeclarationCache': 'cparse',
+    'read_guard': 'guards', 'guard_for': 'guards', 'audit': 'guards',
+    'rewrite_guard': 'guards',
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
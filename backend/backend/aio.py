@@ -0,0 +1,150 @@
+import asyncio
+from .filemaker import FileMaker
+
+async def refuse(filename: str) -> bool:
+    """
+    Overwrite policy keeping every existing file (the default)
+    """
+    return False
+
+async def overwrite(filename: str) -> bool:
+    """
+    Overwrite policy replacing every existing file
+    """
+    return True
+
+class FileResult:
+    def __init__(self, name: str, file: str, outcome: str, error: str = None):
+        """
+        Outcome of creating a single file
+
+        Args:
+            name    (str): name of the file as it was given
+            file    (str): name of the file that was (or would have been) written
+            outcome (str): "created", "unchanged", "exists" (kept by the
+                           overwrite policy) or "failed"
+            error   (str): why the file could not be created, if it failed
+        """
+        self.name: str = name
+        self.file: str = file
+        self.outcome: str = outcome
+        self.error: str = error
+
+    @property
+    def created(self) -> bool:
+        return self.outcome == "created"
+
+    def __repr__(self) -> str:
+        error: str = f", error={self.error!r}" if self.error else ""
+        return f"FileResult({self.file!r}, {self.outcome!r}{error})"
+
+class AsyncFileMaker:
+    def __init__(self, name: str, extension: str, policy=refuse, limit: int = 8):
+        """
+        Create files from asyncio code without blocking the event loop
+
+        File system work runs on worker threads, at most limit files at a
+        time. Nothing is printed, prompted or recorded in Config: every
+        file gets a FileResult instead. An instance belongs to the event
+        loop it is first used on.
+
+        Args:
+            name          (str): String name of the program
+            extension     (str): The new file's extension
+            policy   (callable): async function deciding if an existing file
+                                 may be overwritten, given its name
+            limit         (int): number of files worked on at once
+            file_template (str): The actual contents to be written
+            update       (bool): leave files already holding the contents alone
+        """
+        self.maker: FileMaker = FileMaker(name, extension)
+        self.policy = policy
+        self.limit: int = max(1, limit)
+        self.file_template: str = ""
+        self.update: bool = False
+        self.slots = asyncio.Semaphore(self.limit)
+        # Policies may ask a person, so decisions are made one at a time
+        self.deciding = asyncio.Lock()
+
+    def probe(self, filename: str, content: str) -> tuple:
+        """
+        Stat a filename and compare it with its contents (runs on a worker thread)
+
+        Returns:
+            tuple: (is_dir, exists, unchanged)
+        """
+        is_dir, exists = self.maker.probe(filename)
+        unchanged: bool = (self.update and exists
+                           and self.maker.unchanged(self.maker.target(filename), content))
+
+        return is_dir, exists, unchanged
+
+    async def create_file(self, filename: str, template: str = None) -> FileResult:
+        """
+        Create a single file
+
+        Args:
+            filename (str): name of the file to be created
+            template (str): contents to write instead of file_template
+
+        Returns:
+            FileResult: What happened to the file
+        """
+        content: str = self.file_template if template is None else template
+        target: str = self.maker.target(filename)
+
+        async with self.slots:
+            is_dir, exists, unchanged = await asyncio.to_thread(self.probe, filename, content)
+
+        if is_dir:
+            return FileResult(filename, target, "failed", f"{filename} is a directory")
+
+        if unchanged:
+            return FileResult(filename, target, "unchanged")
+
+        if exists:
+            async with self.deciding:
+                allowed: bool = await self.policy(target)
+
+            if not allowed:
+                return FileResult(filename, target, "exists")
+
+        async with self.slots:
+            error: str = await asyncio.to_thread(self.maker.write_file, target, content, self.update)
+
+        if error is not None:
+            return FileResult(filename, target, "failed", error)
+
+        return FileResult(filename, target, "created")
+
+    async def create_files(self, filenames, render=None) -> list:
+        """
+        Create many files at once
+
+        Names are taken a bounded chunk at a time, so memory stays flat no
+        matter how many are given.
+
+        Args:
+            filenames (iterable): names of the files to be created
+            render    (callable): optional function returning the contents
+                                  for a given file name (default: file_template)
+
+        Returns:
+            list: A FileResult for every file name, in order
+        """
+        results: list = []
+
+        # A name writing the same file as an earlier one in its chunk waits
+        # for the next chunk, so the policy sees that file as existing
+        for chunk in self.maker.chunks(filenames, self.limit * FileMaker.CHUNK_SIZE):
+            results += await asyncio.gather(*(
+                self.create_file(filename, None if render is None else render(filename))
+                for filename in chunk))
+
+        return results
+
+    async def finish(self) -> None:
+        """
+        Save the hash index used by update mode
+        """
+        await asyncio.to_thread(self.maker.index.save)
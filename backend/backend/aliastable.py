@@ -0,0 +1,146 @@
+import os
+import time
+import struct
+from array import array
+from random import random, randrange
+
+MAGIC: bytes = b"PSAT"
+VERSION: int = 2
+
+# magic, version, number of entries, number of libraries, time it was built
+HEADER = struct.Struct("=4sIQI4xd")
+# generation, plays and size of a library when the table was built
+STAMP = struct.Struct("=QQQ")
+# probability of keeping the entry, entry to use otherwise
+ENTRY = struct.Struct("=dI")
+
+class AliasTable:
+    def __init__(self, path: str):
+        """
+        Persistent Walker alias table for O(1) weighted picks
+
+        Building the table is linear in the number of entries, after that a
+        pick reads a single slot of the memory-mapped file, however many
+        entries there are. The stamps of the libraries it was built from
+        are kept in the header so callers can tell when it is out of date.
+
+        Args:
+            path (str): file holding the table
+        """
+        self.path: str = path
+        self.file = None
+        self.map = None
+
+    def open(self) -> bool:
+        """
+        Map the table
+
+        Returns:
+            bool: False if there is no valid table yet
+        """
+        import mmap
+
+        self.close()
+        try:
+            self.file = open(self.path, "rb")
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            self.close()
+            return False
+
+        if len(self.map) < HEADER.size:
+            self.close()
+            return False
+
+        magic, version, length, libraries, _ = HEADER.unpack_from(self.map, 0)
+        expected: int = HEADER.size + STAMP.size * libraries + ENTRY.size * length
+        if magic != MAGIC or version != VERSION or len(self.map) != expected:
+            self.close()
+            return False
+
+        return True
+
+    def stamps(self) -> list:
+        """
+        Returns:
+            list: (generation, plays, size) of every library the table was built from
+        """
+        _, _, _, libraries, _ = HEADER.unpack_from(self.map, 0)
+        return [STAMP.unpack_from(self.map, HEADER.size + STAMP.size * a)
+                for a in range(libraries)]
+
+    def built(self) -> float:
+        """
+        Returns:
+            float: time.time() when the table was built
+        """
+        return HEADER.unpack_from(self.map, 0)[4]
+
+    def build(self, weights, stamps: list) -> None:
+        """
+        Build the table with Vose's method and replace the file atomically
+
+        Args:
+            weights (iterable): weight of every entry, in order
+            stamps      (list): (generation, plays, size) of every library
+        """
+        scaled = array("d", weights)
+        length: int = len(scaled)
+        total: float = sum(scaled)
+
+        if total <= 0:
+            scaled = array("d", [1.0]) * length
+            total = float(length)
+
+        factor: float = length / total if length else 0.0
+        for a in range(length):
+            scaled[a] *= factor
+
+        prob = array("d", [1.0]) * length
+        alias = array("I", range(length))
+        small: list = [a for a in range(length) if scaled[a] < 1.0]
+        large: list = [a for a in range(length) if scaled[a] >= 1.0]
+
+        while small and large:
+            less: int = small.pop()
+            more: int = large[-1]
+            prob[less] = scaled[less]
+            alias[less] = more
+
+            scaled[more] += scaled[less] - 1.0
+            if scaled[more] < 1.0:
+                small.append(large.pop())
+
+        # Whatever is left only differs from 1.0 by rounding
+        self.close()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp: str = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, length, len(stamps), time.time()))
+            f.write(b"".join(STAMP.pack(*stamp) for stamp in stamps))
+            f.write(b"".join(ENTRY.pack(prob[a], alias[a]) for a in range(length)))
+        os.replace(tmp, self.path)
+
+        self.open()
+
+    def pick(self) -> int:
+        """
+        Returns:
+            int: Index of a weighted random entry, None if the table is empty
+        """
+        _, _, length, libraries, _ = HEADER.unpack_from(self.map, 0)
+        if not length:
+            return None
+
+        a: int = randrange(length)
+        prob, alias = ENTRY.unpack_from(self.map, HEADER.size + STAMP.size * libraries
+                                        + ENTRY.size * a)
+        return a if random() < prob else alias
+
+    def close(self) -> None:
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        if self.file is not None:
+            self.file.close()
+            self.file = None
@@ -0,0 +1,131 @@
+import os
+import sys
+import importlib
+
+# Program name -> module holding its main(argv)
+TOOLS: dict = {
+    "cproject": "backend.tools.cproject",
+    "ctouch": "backend.tools.ctouch",
+    "htouch": "backend.tools.htouch",
+    "makefile": "backend.tools.makefile",
+    "pytouch": "backend.tools.pytouch",
+    "random_meme": "backend.tools.random_meme",
+}
+
+def usage():
+    print("Usage: py_scripts TOOL [option]...")
+    print("       py_scripts serve [--status | --stop]")
+
+def help_menu():
+    usage()
+    print("Run one of the py_scripts programs from a single entry point.\n")
+    print("The program is picked from the name this was called with (so a")
+    print("symlink named ctouch runs ctouch) or from the first argument.\n")
+    print("Tools:")
+    for tool in TOOLS:
+        print(f"  {tool}")
+    print("""
+  serve          keep the tools loaded in a background server, tools
+                 go through it while it runs (PY_SCRIPTS_NO_SERVER=1
+                 to bypass it)
+      --status   tell if a server is running
+      --stop     stop the running server
+
+      --help     display this help information and exit
+
+Report bugs to: <https://github.com/RileyMeta/py_scripts/pulls>""")
+
+def tool_name(program: str) -> str:
+    """
+    Args:
+        program (str): argv[0] as the program was called
+
+    Returns:
+        str: The tool the name refers to, None if it is not a tool
+    """
+    name: str = os.path.basename(program)
+    if name.endswith(".py"):
+        name = name[:-3]
+
+    return name if name in TOOLS else None
+
+def run(tool: str, argv: list) -> int:
+    """
+    Import a single tool and run it
+
+    The tool runs on the server when one is listening, otherwise only
+    the requested module is imported, the others are never loaded.
+
+    Args:
+        tool  (str): key of the tool in TOOLS
+        argv (list): arguments for the tool, without the program name
+
+    Returns:
+        int: The tool's exit status
+    """
+    from .client import run as run_remote
+    status: int = run_remote(tool, argv)
+    if status is not None:
+        return status
+
+    module = importlib.import_module(TOOLS[tool])
+    return module.main(argv)
+
+def serve(argv: list) -> int:
+    """
+    Start, query or stop the server
+
+    Args:
+        argv (list): arguments of the serve command
+
+    Returns:
+        int: The exit status
+    """
+    from .client import request, socket_path
+
+    if argv == ["--status"]:
+        reply: dict = request({"op": "ping"})
+        if reply is None:
+            print("py_scripts: no server is running")
+            return 1
+        print(f"py_scripts: server {reply['pid']} is listening on {socket_path()}")
+        return 0
+
+    if argv == ["--stop"]:
+        if request({"op": "stop"}) is None:
+            print("py_scripts: no server is running")
+            return 1
+        return 0
+
+    if argv:
+        usage()
+        return 2
+
+    from .server import serve as start
+    return start()
+
+def main(argv: list = None) -> int:
+    if argv is None:
+        argv = sys.argv
+
+    tool: str = tool_name(argv[0]) if argv else None
+    if tool is not None:
+        return run(tool, argv[1:])
+
+    if len(argv) > 1 and argv[1] in TOOLS:
+        return run(argv[1], argv[2:])
+
+    if len(argv) > 1 and argv[1] == "serve":
+        return serve(argv[2:])
+
+    if len(argv) > 1 and argv[1] == "--help":
+        help_menu()
+        return 0
+
+    if len(argv) > 1:
+        print(f"[py_scripts] Error: unknown tool '{argv[1]}'")
+    usage()
+    return 2
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+import os
+import sys
+
+# Tools the server can run, the others always run in-process
+SERVED: tuple = ("ctouch", "htouch", "pytouch", "makefile", "cproject")
+
+def socket_path() -> str:
+    """
+    Returns:
+        str: Path of the server's socket for the current user
+    """
+    runtime: str = os.environ.get("XDG_RUNTIME_DIR", "")
+    if runtime and os.path.isdir(runtime):
+        return os.path.join(runtime, "py_scripts.sock")
+
+    return f"/tmp/py_scripts-{os.getuid()}.sock"
+
+def probe(path: str):
+    """
+    Connect to a socket, whatever PY_SCRIPTS_NO_SERVER says
+
+    Args:
+        path (str): socket of the server
+
+    Returns:
+        socket.socket: The connection, None if no server is listening
+    """
+    if not os.path.exists(path):
+        return None
+
+    import socket
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+        owner: int = peer_uid(sock)
+    except OSError:
+        sock.close()
+        return None
+
+    # Anyone can create the socket in /tmp first, only talk to our own server
+    if owner != os.getuid():
+        sock.close()
+        return None
+
+    return sock
+
+def peer_uid(sock) -> int:
+    """
+    Args:
+        sock (socket.socket): a connected Unix socket
+
+    Returns:
+        int: The uid of the process on the other end (from SO_PEERCRED, or
+             the owner of the socket file where that is not available)
+    """
+    import socket
+    peercred = getattr(socket, "SO_PEERCRED", None)
+    if peercred is None:
+        return os.lstat(sock.getpeername()).st_uid
+
+    import struct
+    creds: bytes = sock.getsockopt(socket.SOL_SOCKET, peercred, struct.calcsize("3i"))
+    _, uid, _ = struct.unpack("3i", creds)
+    return uid
+
+def connect():
+    """
+    Open a connection to a running server
+
+    Returns:
+        socket.socket: The connection, None if no server is listening
+    """
+    if os.environ.get("PY_SCRIPTS_NO_SERVER"):
+        return None
+
+    return probe(socket_path())
+
+def request(message: dict) -> dict:
+    """
+    Send a single request and wait for its reply
+
+    Args:
+        message (dict): the request, see backend.server
+
+    Returns:
+        dict: The reply, None if no server is listening
+    """
+    import json
+
+    sock = connect()
+    if sock is None:
+        return None
+
+    with sock, sock.makefile("rwb") as stream:
+        stream.write(json.dumps(message).encode() + b"\n")
+        stream.flush()
+        line: bytes = stream.readline()
+
+    return json.loads(line) if line else None
+
+def ask(prompt: str) -> str:
+    """
+    Answer a prompt relayed by the server on the client's terminal
+
+    Args:
+        prompt (str): text to show before reading the answer
+
+    Returns:
+        str: The answer, "n" once stdin is exhausted
+    """
+    try:
+        return input(prompt)
+    except EOFError:
+        return "n"
+
+def run(tool: str, argv: list) -> int:
+    """
+    Run a tool on the server, relaying its output and prompts
+
+    Names read from stdin ("-") need the client's stdin, so those runs
+    always stay in-process.
+
+    Args:
+        tool  (str): name of the tool
+        argv (list): arguments for the tool, without the program name
+
+    Returns:
+        int: The tool's exit status, None if it has to run in-process
+    """
+    if tool not in SERVED or any(arg == "-" or arg.endswith("=-") for arg in argv):
+        return None
+
+    sock = connect()
+    if sock is None:
+        return None
+
+    import json
+
+    umask: int = os.umask(0)
+    os.umask(umask)
+    message: dict = {"op": "run", "tool": tool, "argv": argv,
+                     "cwd": os.getcwd(), "umask": umask}
+
+    with sock, sock.makefile("rwb") as stream:
+        stream.write(json.dumps(message).encode() + b"\n")
+        stream.flush()
+
+        for line in stream:
+            reply: dict = json.loads(line)
+            if "out" in reply:
+                sys.stdout.write(reply["out"])
+            elif "ask" in reply:
+                sys.stdout.flush()
+                stream.write(json.dumps({"answer": ask(reply["ask"])}).encode() + b"\n")
+                stream.flush()
+            elif "exit" in reply:
+                sys.stdout.flush()
+                return reply["exit"]
+
+    print(f"[{tool}] Error: lost the connection to the server")
+    return 1
@@ -0,0 +1,216 @@
+import os
+import re
+import threading
+from .fsutil import cache_dir
+
+LITERAL: str = r'"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\''
+COMMENT = re.compile(r'//[^\n]*|/\*.*?\*/|' + LITERAL, re.S)
+DIRECTIVE = re.compile(r'^[ \t]*#(?:[^\n]*\\\n)*[^\n]*', re.M)
+DEFINE = re.compile(r'#\s*define\s+(\w+)')
+SYSTEM_INCLUDE = re.compile(r'#\s*include\s*<[^>]+>')
+FUNCTION = re.compile(r'^(?P<head>[\w\s\*]*?[\w\*])\s*\b(?P<name>\w+)\s*\((?P<args>(?:[^()]|\([^()]*\))*)\)$', re.S)
+AGGREGATE = re.compile(r'^(typedef\s+)?(struct|union|enum)\b')
+KEYWORDS: tuple = ("if", "for", "while", "switch", "return", "sizeof", "main")
+
+# Bumped whenever extract_declarations changes its output, drops cached results
+VERSION: int = 2
+
+def strip_comments(source: str) -> str:
+    """
+    Remove comments, keeping string and character literals intact
+
+    Args:
+        source (str): C source code
+
+    Returns:
+        str: The source without comments
+    """
+    def replace(match: re.Match) -> str:
+        text: str = match.group(0)
+        return " " if text.startswith("/") else text
+
+    return COMMENT.sub(replace, source)
+
+def blank_literals(source: str) -> str:
+    """
+    Replace the contents of string and character literals with spaces
+
+    Offsets are unchanged, so positions found in the result can be used
+    to slice the original source.
+
+    Args:
+        source (str): C source code without comments
+
+    Returns:
+        str: The source with empty literals of the same length
+    """
+    def replace(match: re.Match) -> str:
+        text: str = match.group(0)
+        return text[0] + " " * (len(text) - 2) + text[-1]
+
+    return re.sub(LITERAL, replace, source)
+
+def extract_declarations(source: str) -> list:
+    """
+    Pull the declarations a header should expose out of a C source file
+
+    This is a light scanner, not a C parser: it collects system includes,
+    #defines, top level struct/union/enum declarations, extern declarations
+    for brace-initialized struct/union/enum objects and prototypes for
+    every function definition that is not static (parameters may contain
+    one level of parentheses, like function pointers).
+
+    Args:
+        source (str): C source code
+
+    Returns:
+        list: The declarations, in the order they appear
+    """
+    source = strip_comments(source)
+    declarations: list = []
+
+    for match in DIRECTIVE.finditer(source):
+        directive: str = match.group(0).strip()
+        if SYSTEM_INCLUDE.match(directive) or DEFINE.match(directive):
+            declarations.append(directive)
+
+    code: str = DIRECTIVE.sub("", source)
+    # Braces inside literals must not move the depth
+    scan: str = blank_literals(code)
+    start: int = 0
+    depth: int = 0
+    body_start: int = 0
+    head: str = ""
+
+    for i, char in enumerate(scan):
+        if char == "{":
+            if depth == 0:
+                head = " ".join(code[start:i].split())
+                body_start = i
+            depth += 1
+        elif char == "}" and depth > 0:
+            depth -= 1
+            if depth == 0:
+                function = FUNCTION.match(head)
+                if function and function.group("name") not in KEYWORDS:
+                    if "static" not in function.group("head").split():
+                        declarations.append(f"{head};")
+                    start = i + 1
+                elif not AGGREGATE.match(head):
+                    # Initializers and the like, skip to the closing ;
+                    start = i + 1
+        elif char == ";" and depth == 0:
+            statement: str = " ".join(scan[start:i].split())
+            if AGGREGATE.match(statement) and "=" in statement.split("{")[0]:
+                # An initialized object, the definition stays in the source
+                name: str = " ".join(code[start:body_start].split("=")[0].split())
+                declarations.append(f"extern {name};")
+            elif AGGREGATE.match(statement) and "{" in statement:
+                body: str = "\n".join(line.rstrip() for line in code[body_start:i].splitlines())
+                declarations.append(" ".join(code[start:body_start].split()) + f" {body.strip()};")
+            start = i + 1
+
+    return declarations
+
+def parse_file(path: str) -> list:
+    """
+    Args:
+        path (str): C source file
+
+    Returns:
+        list: The declarations found in the file
+    """
+    with open(path, 'r', errors="replace") as f:
+        return extract_declarations(f.read())
+
+class DeclarationCache:
+    def __init__(self, path: str = None):
+        """
+        Remember the declarations of already parsed files by mtime and size
+
+        Args:
+            path (str): path of the cache file
+        """
+        self.path: str = path or cache_dir("declarations.json")
+        self.entries: dict = None
+        self.dirty: bool = False
+        self.lock = threading.Lock()
+
+    def load(self) -> dict:
+        if self.entries is None:
+            import json
+            try:
+                with open(self.path, 'r') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError):
+                self.entries = {}
+
+            # Results of an older scanner may be wrong, parse everything again
+            if not isinstance(self.entries, dict) or self.entries.pop("version", None) != VERSION:
+                self.entries = {}
+
+        return self.entries
+
+    def scan(self, sources: list, workers: int = 1) -> dict:
+        """
+        Get the declarations of many files, only parsing the stale ones
+
+        Stale files are parsed on a process pool when workers > 1.
+
+        Args:
+            sources (list): C source files
+            workers  (int): number of worker processes
+
+        Returns:
+            dict: source path -> list of declarations
+        """
+        entries: dict = self.load()
+        results: dict = {}
+        stale: list = []
+
+        for source in sources:
+            key: str = os.path.abspath(source)
+            st: os.stat_result = os.stat(key)
+            entry: list = entries.get(key)
+
+            if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                results[source] = entry[2]
+            else:
+                stale.append((source, key, st))
+
+        if stale:
+            paths: list = [key for _, key, _ in stale]
+
+            if workers > 1 and len(stale) > 1:
+                from concurrent.futures import ProcessPoolExecutor
+
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    parsed = list(pool.map(parse_file, paths, chunksize=16))
+            else:
+                parsed = [parse_file(path) for path in paths]
+
+            with self.lock:
+                for (source, key, st), declarations in zip(stale, parsed):
+                    entries[key] = [st.st_mtime_ns, st.st_size, declarations]
+                    results[source] = declarations
+                self.dirty = True
+
+        return results
+
+    def save(self) -> None:
+        """
+        Atomically write the cache back if anything changed
+        """
+        if not self.dirty:
+            return None
+
+        import json
+        tmp: str = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp, 'w') as f:
+                json.dump({"version": VERSION, **self.entries}, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+            self.dirty = False
+        except OSError as e:
+            print(f"Error [DeclarationCache]: {e}")
@@ -1,12 +1,24 @@
-from pathlib import Path
-from getpass import getpass
+import os
+import sys
+from .journal import Journal
+from .hashindex import HashIndex, digest
 
 class Config:
     VERBOSE: bool = False
-    FAILURES: list = []
-    SUCCESSES: list = []
+    JOBS: int = 1
+    STDIN_BUSY: bool = False
+    UPDATE: bool = False
+    # Hash index used by UPDATE, None for the one in the cache
+    INDEX: str = None
+    RESULTS: Journal = Journal()
+    # When set, answers to prompts are read through ASK(prompt) instead of
+    # the terminal (used by the server to ask its client)
+    ASK = None
 
 class FileMaker:
+    # Names handed to each worker per chunk in iter_create
+    CHUNK_SIZE: int = 256
+
     def __init__(self, name: str, extension: str):
         """
         Initialize the FileMaker class for a program
@@ -15,10 +27,13 @@ class FileMaker:
             name          (str): String name of the program
             extension     (str): The new file's extension
             file_template (str): The actual contents to be written
+            noun          (str): What is being created, used in the report
         """
         self.name: str = name
         self.extension: str = extension
         self.file_template: str = ""
+        self.noun: str = "file"
+        self.index: HashIndex = HashIndex(Config.INDEX)
 
     def confirm_overwrite(self, filename: str) -> bool:
         """
@@ -36,40 +51,90 @@ class FileMaker:
         try:
             while True:
                 print(prompt)
-                response: str = input("[Y]es or [N]o: ").lower()
+                response: str = self.ask("[Y]es or [N]o: ").lower()
 
                 if response in ["y", "yes"]:
                     return True
                 elif response in ["n", "no"]:
                     return False
                 else:
-                    print(f"{repsonse} is not recognized.")
-                    getpass("Press [enter] to continue")
+                    print(f"{response} is not recognized.")
+                    self.pause()
                     continue
         except KeyboardInterrupt as e:
             print("\nOperation was cancelled.")
             sys.exit(-1)
 
-    def clean_filename(self, filename: str) -> str:
+    def probe(self, filename: str) -> tuple:
+        """
+        Stat a filename ahead of creation (safe to run from worker threads)
+
+        Args:
+            filename (str): name of the file to be checked
+
+        Returns:
+            tuple: (is_dir, exists) for the requested file name
+        """
+        if os.path.isdir(filename):
+            return True, False
+
+        return False, os.path.exists(filename) or os.path.exists(f"{filename}{self.extension}")
+
+    def ask(self, prompt: str) -> str:
+        """
+        Read an answer from the user, even when stdin carries a manifest
+
+        Args:
+            prompt (str): text to show before reading the answer
+
+        Returns:
+            str: The answer, "n" if no terminal is available
+        """
+        if Config.ASK is not None:
+            return Config.ASK(prompt)
+
+        if not Config.STDIN_BUSY:
+            return input(prompt)
+
+        try:
+            with open("/dev/tty") as tty:
+                print(prompt, end="", flush=True)
+                return tty.readline().strip()
+        except OSError:
+            return "n"
+
+    def pause(self) -> None:
+        """
+        Wait for the user to press enter
+        """
+        if Config.ASK is not None:
+            Config.ASK("Press [enter] to continue")
+            return None
+
+        from getpass import getpass
+        getpass("Press [enter] to continue")
+
+    def clean_filename(self, filename: str, probe: tuple = None) -> str:
         """
         Clean a filename (remove extension)
 
         Args:
             filename (str): the name of the file to be cleaned
+            probe   (tuple): result of a previous probe() call, if any
 
         Returns:
             str: The cleaned file name
         """
-        full_name: str = Path(filename)
-        full_fb: str = Path(f"{filename}{self.extension}")
+        full_name: str = os.path.normpath(filename)
+        is_dir, exists = probe if probe is not None else self.probe(filename)
 
-        if full_name.is_dir():
+        if is_dir:
             print(f"{self.name}: {full_name} is a directory, please provide a name for the file.")
             return None
 
-        if full_name.exists() or full_fb.exists():
+        if exists:
             if not self.confirm_overwrite(full_name):
-                Config.FAILURES.append(full_name)
+                Config.RESULTS.record("failed", full_name)
                 return None
 
         if filename.endswith(self.extension):
@@ -77,31 +142,274 @@ class FileMaker:
 
         return str(filename)
 
-    def create_file(self, filename: str):
+    def write_file(self, new_file: str, content: str, update: bool = None) -> str:
+        """
+        Write the contents of a single file (safe to run from worker threads)
+
+        Args:
+            new_file (str): full name of the file to be written
+            content  (str): the contents to be written
+            update  (bool): record the hash in the index (default: Config.UPDATE)
+
+        Returns:
+            str: The error message, None on success
+        """
+        if update is None:
+            update = Config.UPDATE
+
+        try:
+            with open(new_file, 'w') as f:
+                f.write(content)
+
+            if update:
+                path: str = os.path.abspath(new_file)
+                self.index.store(path, os.stat(path), digest(content.encode()))
+        except Exception as e:
+            return str(e)
+
+        return None
+
+    def target(self, filename: str) -> str:
+        """
+        Args:
+            filename (str): name of the file as it was given
+
+        Returns:
+            str: The name of the file that will actually be written
+        """
+        if filename.endswith(self.extension):
+            filename = filename.replace(self.extension, "")
+
+        return filename + self.extension
+
+    def unchanged(self, new_file: str, content: str) -> bool:
+        """
+        Check if a file on disk already holds the given contents
+
+        The size is compared first, then the hash (taken from the index when
+        the file's size and mtime still match its entry).
+
+        Args:
+            new_file (str): full name of the file to be written
+            content  (str): the contents that would be written
+
+        Returns:
+            bool: True if writing the file would not change it
+        """
+        data: bytes = content.encode()
+        path: str = os.path.abspath(new_file)
+
+        try:
+            st: os.stat_result = os.stat(path)
+            if st.st_size != len(data):
+                return False
+
+            known: str = self.index.lookup(path, st)
+            if known is None:
+                with open(path, 'rb') as f:
+                    known = digest(f.read())
+                self.index.store(path, st, known)
+        except OSError:
+            return False
+
+        return known == digest(data)
+
+    def record(self, new_file: str, error: str) -> bool:
+        """
+        Record the outcome of a write in the global Config
+
+        Args:
+            new_file (str): full name of the file that was written
+            error    (str): error returned by write_file
+
+        Returns:
+            bool: True if the file was created
+        """
+        if error is None:
+            Config.RESULTS.record("created", new_file)
+            return True
+
+        Config.RESULTS.record("failed", new_file)
+        print(f"[{self.name}] Error: {error}")
+        return False
+
+    def create_file(self, filename: str, template: str = None) -> bool:
         """
         Create the actual file
 
         Args:
             filename (str): name of the file to be created
+            template (str): contents to write instead of file_template
 
         Returns:
-            None: If failed to create file name
+            bool: True if the file was created
         """
-        new_file: str = self.clean_filename(filename)
-        if new_file == None:
-            return None
+        render = None if template is None else (lambda _: template)
 
-        new_file = new_file + self.extension
+        for _, outcome in self.iter_create([filename], render=render):
+            return outcome == "created"
 
-        ft: str = self.file_template
+    def iter_create(self, filenames, workers: int = 1, render=None):
+        """
+        Create files lazily, one bounded chunk of names at a time
 
-        try:
-            with open(new_file, 'w') as f:
-                f.write(ft)
-                Config.SUCCESSES.append(new_file)
-        except Exception as e:
-            Config.FAILURES.append(new_file)
-            print(f"[{self.name}] Error: {e}")
+        Existence checks and writes for a chunk run on a thread pool while
+        conflicts are still confirmed one at a time on the main thread, so
+        memory stays flat no matter how many names are streamed in.
+
+        With Config.UPDATE set, files that already hold the rendered contents
+        are left alone (no prompt, no write) and reported as "unchanged".
+
+        Args:
+            filenames (iterable): names of the files to be created
+            workers        (int): number of worker threads
+            render    (callable): optional function returning the contents
+                                  for a given file name (default: file_template)
+
+        Yields:
+            tuple: (filename, outcome) for every file name, in order, where
+                   outcome is "created", "unchanged" or "failed"
+        """
+        workers = max(1, workers)
+        filenames = iter(filenames)
+
+        def contents(filename: str) -> str:
+            return self.file_template if render is None else render(filename)
+
+        def prepare(filename: str) -> tuple:
+            probe: tuple = self.probe(filename)
+            content: str = None
+
+            if Config.UPDATE and probe[1]:
+                content = contents(filename)
+                if self.unchanged(self.target(filename), content):
+                    return probe, content, True
+
+            return probe, content, False
+
+        def write(job: tuple) -> str:
+            filename, new_file, content = job
+            if content is None:
+                content = contents(filename)
+            return self.write_file(new_file, content)
+
+        if workers == 1:
+            # A single worker runs inline, so the pool machinery is never imported
+            yield from self.run_chunks(filenames, 1, map, prepare, write)
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            yield from self.run_chunks(filenames, workers, pool.map, prepare, write)
+
+    def run_chunks(self, filenames, workers: int, run, prepare, write):
+        """
+        Drive iter_create one chunk at a time with the given map function
+
+        Args:
+            filenames (iterator): names of the files to be created
+            workers        (int): number of workers behind run
+            run       (callable): map-like function used for probes and writes
+            prepare   (callable): probes a file name
+            write     (callable): writes a prepared job
+
+        Yields:
+            tuple: (filename, outcome) for every file name, in order
+        """
+        for chunk in self.chunks(filenames, workers * self.CHUNK_SIZE):
+            prepared: list = list(run(prepare, chunk))
+
+            jobs: list = []
+            results: list = []
+            for filename, (probe, content, unchanged) in zip(chunk, prepared):
+                if unchanged:
+                    Config.RESULTS.record("unchanged", self.target(filename))
+                    results.append("unchanged")
+                    continue
+
+                new_file: str = self.clean_filename(filename, probe)
+                if new_file == None:
+                    results.append("failed")
+                    continue
+
+                results.append(len(jobs))
+                jobs.append((filename, new_file + self.extension, content))
+
+            errors: list = list(run(write, jobs))
+
+            outcomes: list = ["created" if self.record(new_file, error) else "failed"
+                              for (_, new_file, _), error in zip(jobs, errors)]
+
+            for filename, r in zip(chunk, results):
+                yield filename, outcomes[r] if isinstance(r, int) else r
+
+    def chunks(self, filenames, size: int):
+        """
+        Split names into chunks that never write the same file twice
+
+        Everything in a chunk is probed before any of it is written, so a
+        name whose target is already in the current chunk starts the next
+        one. It is then probed after the first file was written, and goes
+        through the usual overwrite check.
+
+        Args:
+            filenames (iterable): names of the files to be created
+            size           (int): most names in a chunk
+
+        Yields:
+            list: The next chunk of names
+        """
+        chunk: list = []
+        targets: set = set()
+
+        for filename in filenames:
+            target: str = os.path.normpath(self.target(filename))
+            if len(chunk) >= size or target in targets:
+                yield chunk
+                chunk = []
+                targets = set()
+
+            chunk.append(filename)
+            targets.add(target)
+
+        if chunk:
+            yield chunk
+
+    def create_files(self, filenames, workers: int = 1, render=None) -> int:
+        """
+        Create many files at once (see iter_create)
+
+        Args:
+            filenames (iterable): names of the files to be created
+            workers        (int): number of worker threads
+            render    (callable): optional function returning the contents
+                                  for a given file name (default: file_template)
+
+        Returns:
+            int: The number of files that were created
+        """
+        outcomes = self.iter_create(filenames, workers, render)
+        return sum(outcome == "created" for _, outcome in outcomes)
+
+    def report(self, lines: list, outcome: str) -> None:
+        """
+        Add the numbered list of recent files with an outcome to a report
+
+        Args:
+            lines    (list): the report being built
+            outcome   (str): the outcome to list
+        """
+        results: Journal = Config.RESULTS
+        total: int = results.count(outcome)
+        recent: list = results.entries(outcome)
+        first: int = total - len(recent) + 1
+
+        if first > 1:
+            where: str = f" (see {results.path})" if results.path else ""
+            lines.append(f"  ... {first - 1} earlier {self.noun}(s) not shown{where}\n")
+
+        for a, file in enumerate(recent, first):
+            lines.append(f"  {a}. {file}\n")
 
     def finish(self) -> None:
         """
@@ -110,17 +418,26 @@ class FileMaker:
         Returns:
             None: There is nothign to return
         """
-        successes: list = Config.SUCCESSES
-        success_len: int = len(successes)
-        print(f"{self.name}: {success_len} file(s) created.")
+        results: Journal = Config.RESULTS
+        results.close()
+        self.index.save()
+
+        lines: list = []
+        lines.append(f"{self.name}: {results.count('created')} {self.noun}(s) created.\n")
+
+        unchanged_len: int = results.count("unchanged")
+        if unchanged_len > 0:
+            lines.append(f"{self.name}: {unchanged_len} {self.noun}(s) unchanged.\n")
+            if Config.VERBOSE:
+                self.report(lines, "unchanged")
 
         if Config.VERBOSE:
-            for a, file in enumerate(successes, 1):
-                print(f"  {a}. {file}")
+            self.report(lines, "created")
 
-        fails: list = Config.FAILURES
-        fail_len: int = len(Config.FAILURES)
+        fail_len: int = results.count("failed")
         if fail_len > 0:
-            print(f"There were {fail_len} files that could not be created:")
-            for a, file in enumerate(fails, 1):
-                print(f"  {a}. {file}")
+            lines.append(f"There were {fail_len} {self.noun}s that could not be created:\n")
+            self.report(lines, "failed")
+
+        sys.stdout.write("".join(lines))
+        sys.stdout.flush()
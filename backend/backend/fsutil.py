@@ -0,0 +1,282 @@
+import os
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# ioctl request from <linux/fs.h>, share the source's extents with the target
+FICLONE: int = 0x40049409
+
+def clone_file(src: str, dst: str) -> str:
+    """
+    Copy a file as cheaply as the filesystem allows
+
+    Tries a reflink first (FICLONE), then an in-kernel copy_file_range,
+    and finally falls back to a plain copy.
+
+    Args:
+        src (str): file to be copied
+        dst (str): new file (truncated if it exists)
+
+    Returns:
+        str: The method that was used
+    """
+    with open(src, 'rb') as fs, open(dst, 'wb') as fd:
+        if fcntl is not None:
+            try:
+                fcntl.ioctl(fd.fileno(), FICLONE, fs.fileno())
+                return "reflink"
+            except OSError:
+                pass
+
+        if hasattr(os, "copy_file_range"):
+            try:
+                while os.copy_file_range(fs.fileno(), fd.fileno(), 1 << 30):
+                    pass
+                return "copy_file_range"
+            except OSError:
+                fs.seek(0)
+                fd.seek(0)
+                fd.truncate()
+
+        from shutil import copyfileobj
+        copyfileobj(fs, fd)
+        return "copy"
+
+def clone_tree(src: str, dst: str) -> None:
+    """
+    Recreate a directory tree, cloning every file with clone_file
+
+    Args:
+        src (str): tree to be copied
+        dst (str): new tree (may already exist)
+    """
+    for root, dirs, files in os.walk(src):
+        target: str = os.path.join(dst, os.path.relpath(root, src))
+        os.makedirs(target, exist_ok=True)
+
+        for file in files:
+            clone_file(os.path.join(root, file), os.path.join(target, file))
+
+def scan_tree(root: str, suffixes: tuple = ()):
+    """
+    Walk a tree with os.scandir, yielding matching files as they are found
+
+    Symlinked directories are not followed.
+
+    Args:
+        root      (str): directory to walk
+        suffixes (tuple): only yield files ending with one of these
+
+    Yields:
+        os.DirEntry: Every matching file
+    """
+    pending: list = [root]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif not suffixes or entry.name.endswith(suffixes):
+                        yield entry
+        except OSError:
+            continue
+
+def walk_parallel(roots, visit, workers: int = 8):
+    """
+    Walk trees with several directories being read at once
+
+    visit(item) runs on worker threads (so slow reads, like on a network
+    filesystem, overlap) and returns (result, children): the children are
+    visited next and the result is yielded on the calling thread as soon
+    as it is ready, in no particular order.
+
+    Args:
+        roots (iterable): items to visit first
+        visit (callable): reads one directory, see above
+        workers    (int): number of directories read at once
+
+    Yields:
+        The result of every visit
+    """
+    if workers <= 1:
+        pending: list = list(roots)
+        while pending:
+            result, children = visit(pending.pop())
+            pending.extend(children)
+            yield result
+        return
+
+    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        running: set = {pool.submit(visit, root) for root in roots}
+        while running:
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                result, children = future.result()
+                running.update(pool.submit(visit, child) for child in children)
+                yield result
+
+def which(program: str, path: str = None) -> str:
+    """
+    Find an executable on PATH in-process (like shutil.which, without a shell)
+
+    Args:
+        program (str): name of the program, or a path to it
+        path    (str): directories to search (default: $PATH)
+
+    Returns:
+        str: The path of the executable, None if it was not found
+    """
+    def executable(candidate: str) -> bool:
+        return os.path.isfile(candidate) and os.access(candidate, os.X_OK)
+
+    if os.sep in program:
+        return program if executable(program) else None
+
+    if path is None:
+        path = os.environ.get("PATH", os.defpath)
+
+    for directory in path.split(os.pathsep):
+        candidate: str = os.path.join(directory or os.curdir, program)
+        if executable(candidate):
+            return candidate
+
+    return None
+
+def cache_dir(*parts: str) -> str:
+    """
+    Args:
+        parts (str): path components below the py_scripts cache
+
+    Returns:
+        str: $XDG_CACHE_HOME/py_scripts/... (~/.cache/py_scripts/...)
+    """
+    cache: str = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache, "py_scripts", *parts)
+
+def fsync_path(path: str) -> None:
+    """
+    Flush a file or directory to disk
+
+    Args:
+        path (str): file or directory to be flushed
+    """
+    fd: int = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def fsync_tree(path: str, files: bool = True) -> None:
+    """
+    Flush every file and directory of a tree to disk in one pass
+
+    Args:
+        path   (str): root of the tree
+        files (bool): also flush the files, not only the directories
+    """
+    for root, dirs, names in os.walk(path):
+        if files:
+            for name in names:
+                fsync_path(os.path.join(root, name))
+        fsync_path(root)
+
+def remove_entry(path: str, is_dir: bool) -> None:
+    """
+    Remove a file or a whole directory tree with os.scandir
+
+    Args:
+        path    (str): path to be removed
+        is_dir (bool): True if path is a real directory (not a symlink)
+    """
+    if not is_dir:
+        os.unlink(path)
+        return None
+
+    with os.scandir(path) as entries:
+        for entry in entries:
+            remove_entry(entry.path, entry.is_dir(follow_symlinks=False))
+
+    os.rmdir(path)
+
+def remove_tree(path: str, workers: int = 4) -> None:
+    """
+    Remove a directory tree, spreading its top level over worker threads
+
+    Args:
+        path    (str): directory to be removed
+        workers (int): number of worker threads
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with os.scandir(path) as entries:
+        jobs: list = [(entry.path, entry.is_dir(follow_symlinks=False))
+                      for entry in entries]
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        list(pool.map(lambda job: remove_entry(*job), jobs))
+
+    os.rmdir(path)
+
+# renameat2() flag from <linux/fs.h>, atomically swap the two paths
+RENAME_EXCHANGE: int = 2
+AT_FDCWD: int = -100
+
+def exchange(a: str, b: str) -> bool:
+    """
+    Atomically swap two paths with renameat2(RENAME_EXCHANGE)
+
+    Args:
+        a (str): first path
+        b (str): second path, both have to exist
+
+    Returns:
+        bool: False if the system or filesystem can't swap (nothing moved)
+
+    Raises:
+        OSError: the swap is supported but failed
+    """
+    import ctypes
+    import errno
+
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        renameat2 = libc.renameat2
+    except (OSError, AttributeError):
+        return False
+
+    renameat2.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p,
+                          ctypes.c_uint]
+    if renameat2(AT_FDCWD, os.fsencode(a), AT_FDCWD, os.fsencode(b), RENAME_EXCHANGE) == 0:
+        return True
+
+    error: int = ctypes.get_errno()
+    if error in (errno.ENOSYS, errno.EINVAL, errno.ENOTSUP):
+        return False
+
+    raise OSError(error, os.strerror(error), a, None, b)
+
+def move_to_trash(path: str) -> str:
+    """
+    Atomically move a directory out of the way, next to where it was
+
+    The trash entry is a hidden sibling so the rename never crosses
+    filesystems.
+
+    Args:
+        path (str): directory to be moved
+
+    Returns:
+        str: The new path of the directory
+    """
+    from tempfile import mkdtemp
+
+    parent, name = os.path.split(os.path.normpath(path))
+    trash: str = mkdtemp(prefix=f".{name}.trash-", dir=parent or ".")
+
+    # Renaming a directory over an empty one replaces it atomically
+    os.rename(path, trash)
+    return trash
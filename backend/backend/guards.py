@@ -0,0 +1,107 @@
+import os
+import re
+from .fsutil import scan_tree
+
+GUARD = re.compile(rb'\A(?:\s|//[^\n]*\n|/\*.*?\*/)*#[ \t]*ifndef[ \t]+(\w+)[ \t]*\r?\n'
+                   rb'(?:\s|//[^\n]*\n|/\*.*?\*/)*#[ \t]*define[ \t]+(\w+)', re.S)
+ENDIF = re.compile(rb'(#[ \t]*endif[ \t]*(?://|/\*)[ \t]*)(\w+)')
+PRAGMA_ONCE = re.compile(rb'^[ \t]*#[ \t]*pragma[ \t]+once\b', re.M)
+IDENTIFIER = re.compile(r'[A-Za-z_]\w*', re.A)
+
+def read_guard(path: str, limit: int = 4096) -> tuple:
+    """
+    Read the include guard from the first few KB of a header
+
+    Args:
+        path  (str): the header
+        limit (int): number of bytes read
+
+    Returns:
+        tuple: (ifndef name, define name), ("", "") for #pragma once,
+               None if the header has no guard
+    """
+    with open(path, 'rb') as f:
+        head: bytes = f.read(limit)
+
+    match = GUARD.match(head)
+    if match:
+        return match.group(1).decode(), match.group(2).decode()
+
+    if PRAGMA_ONCE.search(head):
+        return "", ""
+
+    return None
+
+def guard_for(path: str, root: str) -> str:
+    """
+    Path qualified guard for a header, unique within the tree
+
+    Args:
+        path (str): the header
+        root (str): root of the tree
+
+    Returns:
+        str: e.g. NET_HTTP_CLIENT_H for ROOT/net/http/client.h, prefixed
+             with an H when it would start with a digit (H_3D_VEC_H)
+    """
+    relative: str = os.path.relpath(path, root)
+    guard: str = re.sub(r'\W', "_", relative, flags=re.A).upper()
+    return f"H_{guard}" if guard[:1].isdigit() else guard
+
+def audit(root: str, workers: int = 1) -> list:
+    """
+    Read the guard of every header in a tree
+
+    Args:
+        root    (str): root of the tree
+        workers (int): number of threads reading headers
+
+    Returns:
+        list: (path, guard) pairs sorted by path, guard as read_guard
+    """
+    paths: list = sorted(entry.path for entry in scan_tree(root, (".h",)))
+
+    def read(path: str) -> tuple:
+        try:
+            return read_guard(path)
+        except OSError:
+            return None
+
+    if workers > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            guards: list = list(pool.map(read, paths, chunksize=64))
+    else:
+        guards = [read(path) for path in paths]
+
+    return list(zip(paths, guards))
+
+def rewrite_guard(path: str, guard: tuple, new: str) -> None:
+    """
+    Rename a header's include guard (and a matching #endif comment)
+
+    Args:
+        path   (str): the header
+        guard (tuple): current (ifndef name, define name) from read_guard
+        new    (str): new guard
+    """
+    with open(path, 'rb') as f:
+        source: bytes = f.read()
+
+    match = GUARD.match(source)
+    if not match:
+        return None
+
+    name: bytes = new.encode()
+    old: bytes = guard[0].encode()
+
+    def endif(comment: re.Match) -> bytes:
+        return comment.group(1) + name if comment.group(2) == old else comment.group(0)
+
+    source = (source[:match.start(1)] + name
+              + source[match.end(1):match.start(2)] + name
+              + ENDIF.sub(endif, source[match.end(2):]))
+
+    with open(path, 'wb') as f:
+        f.write(source)
@@ -0,0 +1,94 @@
+import os
+import threading
+from .fsutil import cache_dir
+
+class HashIndex:
+    def __init__(self, path: str = None):
+        """
+        Index of content hashes keyed by (size, mtime)
+
+        A file whose size and mtime still match its entry does not have to
+        be read again to know its hash. Entries are keyed by absolute path,
+        so one index in the cache serves every directory.
+
+        Args:
+            path (str): path of the index file (default: in the cache)
+        """
+        self.path: str = path or cache_dir("hashes.json")
+        self.entries: dict = None
+        self.dirty: bool = False
+        self.lock = threading.Lock()
+
+    def load(self) -> dict:
+        """
+        Load the index file the first time it is needed
+
+        Returns:
+            dict: absolute path -> [size, mtime_ns, digest]
+        """
+        with self.lock:
+            if self.entries is None:
+                import json
+                try:
+                    with open(self.path, 'r') as f:
+                        self.entries = json.load(f)
+                except (OSError, ValueError):
+                    self.entries = {}
+
+        return self.entries
+
+    def lookup(self, path: str, st: os.stat_result) -> str:
+        """
+        Args:
+            path           (str): absolute path of the file
+            st  (os.stat_result): current stat of the file
+
+        Returns:
+            str: The known digest, None if the entry is missing or stale
+        """
+        entry: list = self.load().get(path)
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[2]
+
+        return None
+
+    def store(self, path: str, st: os.stat_result, digest: str) -> None:
+        """
+        Args:
+            path           (str): absolute path of the file
+            st  (os.stat_result): stat of the file the digest belongs to
+            digest         (str): hex digest of the contents
+        """
+        entries: dict = self.load()
+        with self.lock:
+            entries[path] = [st.st_size, st.st_mtime_ns, digest]
+            self.dirty = True
+
+    def save(self) -> None:
+        """
+        Atomically write the index back if anything changed
+        """
+        if not self.dirty:
+            return None
+
+        import json
+        tmp: str = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(tmp, 'w') as f:
+                json.dump(self.entries, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+            self.dirty = False
+        except OSError as e:
+            print(f"Error [HashIndex]: {e}")
+
+def digest(data: bytes) -> str:
+    """
+    Args:
+        data (bytes): contents to hash
+
+    Returns:
+        str: Hex digest used by the index
+    """
+    from hashlib import sha256
+    return sha256(data).hexdigest()
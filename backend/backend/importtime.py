@@ -0,0 +1,117 @@
+"""
+Startup regression check for the py_scripts tools
+
+Imports every tool in a fresh interpreter with -X importtime and reports
+the cumulative import cost. Modules that should only ever be imported on
+demand are flagged when they show up at startup.
+
+Usage:
+    python -m backend.importtime [--budget MS] [TOOL...]
+"""
+import os
+import sys
+import getopt
+import subprocess
+from .cli import TOOLS
+
+# Modules a tool should only pay for once it actually needs them
+DEFERRED: tuple = ("subprocess", "getpass", "datetime", "concurrent.futures",
+                   "tempfile", "pathlib", "shutil", "hashlib", "json")
+
+def usage():
+    print("Usage: python -m backend.importtime [--budget MS] [TOOL...]")
+
+def measure(module: str) -> dict:
+    """
+    Import a module in a fresh interpreter and collect its import times
+
+    Args:
+        module (str): dotted name of the module to import
+
+    Returns:
+        dict: module name -> cumulative import time in microseconds
+    """
+    env: dict = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        env.get("PYTHONPATH")]))
+
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          capture_output=True, text=True, env=env)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+
+    times: dict = {}
+    for line in proc.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+
+    return times
+
+def check(tools: list, budget: float) -> int:
+    """
+    Measure each tool and report the ones over budget or importing too much
+
+    Args:
+        tools   (list): names of the tools to measure
+        budget (float): maximum startup import time in milliseconds, 0 for none
+
+    Returns:
+        int: The number of tools that regressed
+    """
+    failed: int = 0
+
+    for tool in tools:
+        times: dict = measure(TOOLS[tool])
+        total: float = times.get(TOOLS[tool], 0) / 1000
+        eager: list = [name for name in DEFERRED if name in times]
+
+        problems: list = []
+        if budget and total > budget:
+            problems.append(f"over budget ({budget:.1f} ms)")
+        if eager:
+            problems.append(f"imports {', '.join(eager)} at startup")
+
+        status: str = "; ".join(problems) if problems else "ok"
+        print(f"{tool:<12} {total:8.1f} ms  {status}")
+        failed += bool(problems)
+
+    return failed
+
+def main(argv: list = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    try:
+        opts, args = getopt.getopt(argv, "b:", ["budget=", "help"])
+    except getopt.GetoptError as err:
+        print(f"{err}")
+        usage()
+        return 2
+
+    budget: float = 0
+    for opt, arg in opts:
+        if opt == "--help":
+            usage()
+            return 0
+        elif opt in ("-b", "--budget"):
+            try:
+                budget = float(arg)
+            except ValueError:
+                print(f"[importtime] Error: '{arg}' is not a number of milliseconds")
+                return 2
+
+    for tool in args:
+        if tool not in TOOLS:
+            print(f"[importtime] Error: unknown tool '{tool}'")
+            return 2
+
+    return 1 if check(args or list(TOOLS), budget) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+import threading
+from collections import deque
+
+class Journal:
+    def __init__(self, limit: int = 50):
+        """
+        Keep a compact record of what happened to every file
+
+        Only counters and the most recent entries of each outcome are held
+        in memory, the full record can be spilled to a journal file.
+
+        Args:
+            limit (int): number of recent entries kept per outcome
+        """
+        self.limit: int = limit
+        self.counts: dict = {}
+        self.recent: dict = {}
+        self.path: str = ""
+        self.file = None
+        self.lock = threading.Lock()
+
+    def open(self, path: str) -> None:
+        """
+        Spill every recorded entry to a journal file
+
+        Args:
+            path (str): path of the journal file (truncated)
+        """
+        self.close()
+        self.path = path
+        self.file = open(path, 'w', buffering=1 << 16)
+
+    def close(self) -> None:
+        """
+        Flush and close the journal file, if any
+        """
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def record(self, outcome: str, entry) -> None:
+        """
+        Record the outcome of a single file
+
+        Args:
+            outcome (str): what happened (created, failed, ...)
+            entry   (any): the file the outcome belongs to
+        """
+        with self.lock:
+            self.counts[outcome] = self.counts.get(outcome, 0) + 1
+
+            if outcome not in self.recent:
+                self.recent[outcome] = deque(maxlen=self.limit)
+            self.recent[outcome].append(entry)
+
+            if self.file is not None:
+                self.file.write(f"{outcome}\t{entry}\n")
+
+    def count(self, outcome: str) -> int:
+        """
+        Args:
+            outcome (str): the outcome to count
+
+        Returns:
+            int: How many files were recorded with that outcome
+        """
+        return self.counts.get(outcome, 0)
+
+    def entries(self, outcome: str) -> list:
+        """
+        Args:
+            outcome (str): the outcome to list
+
+        Returns:
+            list: The most recent files recorded with that outcome
+        """
+        return list(self.recent.get(outcome, ()))
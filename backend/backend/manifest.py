@@ -0,0 +1,62 @@
+import os
+import sys
+from .filemaker import Config
+
+def read_manifest(source: str, separator: bytes = b"\n", block_size: int = 1 << 16):
+    """
+    Stream file names out of a manifest without loading it whole
+
+    Args:
+        source      (str): path of the manifest, "-" for stdin
+        separator (bytes): b"\\n" for line separated, b"\\0" for NUL separated
+        block_size  (int): number of bytes read at a time
+
+    Yields:
+        str: Every non-empty name in the manifest
+    """
+    if source == "-":
+        Config.STDIN_BUSY = True
+        stream = sys.stdin.buffer
+    else:
+        stream = open(source, "rb")
+
+    try:
+        strip: bytes = b"\r" if separator == b"\n" else b""
+        pending: bytes = b""
+
+        while block := stream.read(block_size):
+            pending += block
+            *names, pending = pending.split(separator)
+
+            for name in names:
+                if name := name.rstrip(strip):
+                    yield os.fsdecode(name)
+
+        if pending := pending.rstrip(strip):
+            yield os.fsdecode(pending)
+    finally:
+        if stream is not sys.stdin.buffer:
+            stream.close()
+
+def iter_names(args: list, manifests: list, separator: bytes = b"\n"):
+    """
+    Chain command line names with the contents of any manifests
+
+    A bare "-" argument reads names from stdin.
+
+    Args:
+        args       (list): names given on the command line
+        manifests  (list): paths given with --from-file
+        separator (bytes): separator used by the manifests
+
+    Yields:
+        str: Every name, in order
+    """
+    for arg in args:
+        if arg == "-":
+            yield from read_manifest(arg, separator)
+        else:
+            yield arg
+
+    for manifest in manifests:
+        yield from read_manifest(manifest, separator)
@@ -0,0 +1,519 @@
+import os
+import time
+from random import randrange
+from .fsutil import cache_dir, walk_parallel
+
+# Bumped whenever the tables change, older indexes are rebuilt from scratch
+VERSION: int = 4
+
+# Weight of an entry for every weighted pick, from its size, mtime and plays
+WEIGHTS: dict = {
+    # Newer files first: a file a day old is half as likely as a new one
+    "age": lambda size, mtime, plays, now: 1.0 / (1.0 + max(0.0, now - mtime) / 86400),
+    # Bigger (usually longer) files first
+    "size": lambda size, mtime, plays, now: float(max(size, 1)),
+    # Files that were played less first
+    "plays": lambda size, mtime, plays, now: 1.0 / (1.0 + plays),
+}
+
+# Play counts only move slowly, so a "plays" table is rebuilt once the
+# libraries were played this many times per entry since it was built
+REBUILD_PLAYS: float = 0.05
+
+# Ages keep moving while nothing changes, so an "age" table is rebuilt
+# once it is this many seconds old
+REBUILD_AGE: float = 86400
+
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS libraries (
+    id         INTEGER PRIMARY KEY,
+    root       TEXT NOT NULL,
+    extensions TEXT NOT NULL,
+    recursive  INTEGER NOT NULL,
+    size       INTEGER NOT NULL,
+    generation INTEGER NOT NULL DEFAULT 0,
+    plays      INTEGER NOT NULL DEFAULT 0,
+    next_id    INTEGER NOT NULL DEFAULT 0,
+    UNIQUE (root, extensions, recursive)
+);
+CREATE TABLE IF NOT EXISTS dirs (
+    library  INTEGER NOT NULL,
+    path     TEXT NOT NULL,
+    parent   TEXT,
+    mtime_ns INTEGER NOT NULL,
+    PRIMARY KEY (library, path)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS media (
+    library INTEGER NOT NULL,
+    pos     INTEGER NOT NULL,
+    id      INTEGER NOT NULL,
+    dir     TEXT NOT NULL,
+    name    TEXT NOT NULL,
+    size    INTEGER NOT NULL,
+    mtime   INTEGER NOT NULL,
+    plays   INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (library, pos)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS media_dir ON media (library, dir);
+CREATE UNIQUE INDEX IF NOT EXISTS media_id ON media (library, id);
+"""
+
+# A directory changed this recently may change again within the same mtime
+# tick, so its listing is not trusted on the next run
+RACY_NS: int = 2_000_000_000
+
+class MediaIndex:
+    def __init__(self, path: str = None):
+        """
+        On-disk index of the media files found in directory trees
+
+        Every directory of a library is kept with its mtime, and only the
+        directories whose mtime changed are listed again. Entries are
+        numbered 0 to size - 1 in each library so a random one can be
+        fetched with a single lookup, and keep their number (and play
+        count) while their directory is listed again. Positions are reused
+        once an entry is gone, so every entry also gets an id that never
+        is.
+
+        Args:
+            path (str): sqlite file holding the index (default: in the cache)
+        """
+        self.path: str = path or cache_dir("media.sqlite")
+        self.db = None
+
+    def connect(self):
+        """
+        Open the index the first time it is needed
+
+        Returns:
+            sqlite3.Connection: The index, kept in memory if the file can't be used
+        """
+        if self.db is not None:
+            return self.db
+
+        import sqlite3
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self.db = sqlite3.connect(self.path, timeout=5)
+            self.create()
+        except (OSError, sqlite3.Error) as e:
+            print(f"Error [MediaIndex]: {e}, the index will not be kept")
+            self.db = sqlite3.connect(":memory:")
+            self.create()
+
+        return self.db
+
+    def create(self) -> None:
+        """
+        Create the tables, dropping those of an older version
+        """
+        version: int = self.db.execute("PRAGMA user_version").fetchone()[0]
+        if version != VERSION:
+            with self.db:
+                for table in ("libraries", "dirs", "media"):
+                    self.db.execute(f"DROP TABLE IF EXISTS {table}")
+                self.db.execute(f"PRAGMA user_version = {VERSION}")
+
+        self.db.executescript(SCHEMA)
+
+    def library(self, root: str, extensions: tuple, recursive: bool = False,
+                workers: int = 8) -> int:
+        """
+        Get the index of a directory tree, listing only what changed since
+
+        Directories are read on a pool of threads and their entries written
+        to the index as each one comes in.
+
+        Args:
+            root        (str): directory holding the media
+            extensions (tuple): file extensions to keep
+            recursive  (bool): also index the subdirectories
+            workers     (int): number of directories read at once
+
+        Returns:
+            int: Id of the library in the index
+
+        Raises:
+            OSError: the root directory can't be read
+        """
+        root = os.path.realpath(os.path.expanduser(root))
+        extensions = tuple(extensions)
+        key: str = ",".join(sorted(extensions))
+        db = self.connect()
+
+        os.stat(root)
+        row: tuple = db.execute("SELECT id FROM libraries WHERE root = ? AND extensions = ? AND recursive = ?",
+                                (root, key, int(recursive))).fetchone()
+        if row is None:
+            with db:
+                library: int = db.execute(
+                    "INSERT INTO libraries (root, extensions, recursive, size) VALUES (?, ?, ?, 0)",
+                    (root, key, int(recursive))).lastrowid
+        else:
+            library = row[0]
+
+        known: dict = {}
+        children: dict = {}
+        for path, parent, mtime_ns in db.execute("SELECT path, parent, mtime_ns FROM dirs WHERE library = ?",
+                                                 (library,)):
+            known[path] = mtime_ns
+            children.setdefault(parent, []).append(path)
+
+        def visit(path: str) -> tuple:
+            # Runs on worker threads: stats the directory and only lists it if it changed
+            full: str = os.path.join(root, path) if path else root
+            try:
+                mtime_ns: int = os.stat(full).st_mtime_ns
+                if known.get(path) == mtime_ns:
+                    return (path, mtime_ns, None), children.get(path, []) if recursive else []
+
+                files: dict = {}
+                subdirs: list = []
+                with os.scandir(full) as entries:
+                    for entry in entries:
+                        if recursive and entry.is_dir(follow_symlinks=False):
+                            subdirs.append(os.path.join(path, entry.name))
+                        elif entry.name.endswith(extensions) and entry.is_file():
+                            try:
+                                st: os.stat_result = entry.stat()
+                            except OSError:
+                                continue
+                            files[entry.name] = (st.st_size, int(st.st_mtime))
+            except OSError:
+                return None, []
+
+            # Stat taken before the listing, so a change made during it shows up next time
+            if time.time_ns() - mtime_ns < RACY_NS:
+                mtime_ns = -1
+
+            return (path, mtime_ns, files), subdirs
+
+        with db:
+            writer = Writer(db, library)
+            seen: set = set()
+
+            for result in walk_parallel([""], visit, workers):
+                if result is None:
+                    continue
+
+                path, mtime_ns, files = result
+                seen.add(path)
+                if files is None:
+                    continue
+
+                writer.update(path, files)
+                db.execute("INSERT OR REPLACE INTO dirs (library, path, parent, mtime_ns) VALUES (?, ?, ?, ?)",
+                           (library, path, os.path.dirname(path) if path else None, mtime_ns))
+
+            # Directories that were not reached any more are gone
+            for path in known.keys() - seen:
+                writer.remove(path)
+                db.execute("DELETE FROM dirs WHERE library = ? AND path = ?", (library, path))
+
+            writer.finish()
+
+        if not seen:
+            raise FileNotFoundError(f"could not read {root}")
+
+        return library
+
+    def size(self, library: int) -> int:
+        """
+        Returns:
+            int: The number of media files in a library
+        """
+        row: tuple = self.connect().execute("SELECT size FROM libraries WHERE id = ?",
+                                            (library,)).fetchone()
+        return row[0] if row else 0
+
+    def entry(self, library: int, pos: int) -> str:
+        """
+        Args:
+            library (int): id of the library
+            pos     (int): position of the entry, from 0 to size() - 1
+
+        Returns:
+            str: Full path of the entry, None if there is none at pos
+        """
+        row: tuple = self.connect().execute(
+            "SELECT l.root, m.dir, m.name FROM media m JOIN libraries l ON l.id = m.library "
+            "WHERE m.library = ? AND m.pos = ?", (library, pos)).fetchone()
+        return os.path.join(*row) if row else None
+
+    def next_id(self, library: int) -> int:
+        """
+        Returns:
+            int: The id the next entry added to a library will get
+        """
+        row: tuple = self.connect().execute("SELECT next_id FROM libraries WHERE id = ?",
+                                            (library,)).fetchone()
+        return row[0] if row else 0
+
+    def ids(self, library: int, start: int = 0) -> list:
+        """
+        Args:
+            library (int): id of the library
+            start   (int): smallest id to return
+
+        Returns:
+            list: Ids of the library's entries from start on, in order
+        """
+        return [id for (id,) in self.connect().execute(
+            "SELECT id FROM media WHERE library = ? AND id >= ? ORDER BY id", (library, start))]
+
+    def position(self, library: int, id: int) -> int:
+        """
+        Args:
+            library (int): id of the library
+            id      (int): id of the entry
+
+        Returns:
+            int: Current position of the entry, None if it is gone
+        """
+        row: tuple = self.connect().execute("SELECT pos FROM media WHERE library = ? AND id = ?",
+                                            (library, id)).fetchone()
+        return row[0] if row else None
+
+    def pick(self, libraries: list) -> tuple:
+        """
+        Args:
+            libraries (list): ids of the libraries to pick from
+
+        Returns:
+            tuple: (library, position) of a random entry, None if they are empty
+        """
+        sizes: list = [self.size(library) for library in libraries]
+        if not sum(sizes):
+            return None
+
+        return self.locate(libraries, sizes, randrange(sum(sizes)))
+
+    def locate(self, libraries: list, sizes: list, pos: int) -> tuple:
+        """
+        Args:
+            libraries (list): ids of the libraries, in order
+            sizes     (list): number of entries of every library
+            pos        (int): position across all of the libraries
+
+        Returns:
+            tuple: (library, position in that library)
+        """
+        for library, size in zip(libraries, sizes):
+            if pos < size:
+                return library, pos
+            pos -= size
+
+    def shuffled(self, libraries: list) -> tuple:
+        """
+        Take the next entry of the libraries' shuffle bag
+
+        Every entry comes up once before any of them repeats, see ShuffleBag.
+
+        Args:
+            libraries (list): ids of the libraries to pick from
+
+        Returns:
+            tuple: (library, position) of the entry, None if they are empty
+        """
+        from .shufflebag import ShuffleBag
+
+        name: str = "-".join(str(library) for library in libraries)
+        path: str = os.path.join(os.path.dirname(self.path), "bags", f"{name}.bag")
+        heads: list = [self.next_id(library) for library in libraries]
+
+        with ShuffleBag(path, len(libraries)) as bag:
+            picked: tuple = bag.next(heads, lambda slot, start: self.ids(libraries[slot], start),
+                                     lambda slot, id: self.position(libraries[slot], id))
+
+        if picked is None:
+            return None
+
+        slot, pos = picked
+        return libraries[slot], pos
+
+    def weighted(self, libraries: list, weight: str) -> tuple:
+        """
+        Pick an entry with a probability following one of the WEIGHTS
+
+        The weights go through an alias table kept next to the index, which
+        is only rebuilt when one of the libraries changed (or, for "plays",
+        was played enough since, and for "age", is a day old), so a pick is
+        O(1).
+
+        Args:
+            libraries (list): ids of the libraries to pick from
+            weight     (str): one of the WEIGHTS
+
+        Returns:
+            tuple: (library, position) of the entry, None if they are empty
+        """
+        from .aliastable import AliasTable
+
+        db = self.connect()
+        stamps: list = [db.execute("SELECT generation, plays, size FROM libraries WHERE id = ?",
+                                   (library,)).fetchone() or (0, 0, 0)
+                        for library in libraries]
+
+        name: str = "-".join(str(library) for library in libraries)
+        table = AliasTable(os.path.join(os.path.dirname(self.path), "alias", f"{name}-{weight}.alias"))
+
+        try:
+            if not table.open() or self.stale(table.stamps(), stamps, weight, table.built()):
+                table.build(self.weights(libraries, weight), stamps)
+
+            picked: int = table.pick()
+        finally:
+            table.close()
+
+        if picked is None:
+            return None
+
+        return self.locate(libraries, [size for _, _, size in stamps], picked)
+
+    def stale(self, built: list, current: list, weight: str, when: float = None) -> bool:
+        """
+        Args:
+            built   (list): stamps the alias table was built from
+            current (list): stamps of the libraries now
+            weight   (str): weight of the table
+            when   (float): time.time() when the table was built
+
+        Returns:
+            bool: True if the table has to be rebuilt
+        """
+        if len(built) != len(current):
+            return True
+
+        for (generation, _, size), (now_generation, _, now_size) in zip(built, current):
+            if generation != now_generation or size != now_size:
+                return True
+
+        if weight == "plays":
+            played: int = sum(now[1] - then[1] for then, now in zip(built, current))
+            entries: int = sum(size for _, _, size in current)
+            return played > max(1, REBUILD_PLAYS * entries)
+
+        if weight == "age" and when is not None:
+            return not 0 <= time.time() - when < REBUILD_AGE
+
+        return False
+
+    def weights(self, libraries: list, weight: str):
+        """
+        Args:
+            libraries (list): ids of the libraries, in order
+            weight     (str): one of the WEIGHTS
+
+        Yields:
+            float: The weight of every entry, in order
+        """
+        function = WEIGHTS[weight]
+        now: float = time.time()
+        db = self.connect()
+
+        for library in libraries:
+            for size, mtime, plays in db.execute(
+                    "SELECT size, mtime, plays FROM media WHERE library = ? ORDER BY pos", (library,)):
+                yield function(size, mtime, plays, now)
+
+    def played(self, library: int, pos: int) -> None:
+        """
+        Count a play of an entry
+
+        Args:
+            library (int): id of the library
+            pos     (int): position of the entry
+        """
+        db = self.connect()
+        with db:
+            db.execute("UPDATE media SET plays = plays + 1 WHERE library = ? AND pos = ?", (library, pos))
+            db.execute("UPDATE libraries SET plays = plays + 1 WHERE id = ?", (library,))
+
+    def close(self) -> None:
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+
+class Writer:
+    def __init__(self, db, library: int):
+        """
+        Keeps the positions of a library's entries dense while it changes
+
+        Removed entries leave holes that added entries fill first, the
+        holes left over are filled with the last entries by finish().
+        Entries that are still there keep their position and play count.
+
+        Args:
+            db (sqlite3.Connection): the index
+            library          (int): id of the library being changed
+        """
+        self.db = db
+        self.library: int = library
+        self.size, self.next_id = db.execute("SELECT size, next_id FROM libraries WHERE id = ?",
+                                             (library,)).fetchone()
+        self.holes: list = []
+        self.changed: bool = False
+
+    def remove(self, path: str) -> None:
+        """
+        Args:
+            path (str): directory whose entries are removed
+        """
+        self.update(path, {})
+
+    def update(self, path: str, files: dict) -> None:
+        """
+        Bring the entries of a directory in line with a new listing
+
+        Args:
+            path   (str): directory holding the files
+            files (dict): name -> (size, mtime) of every file now in it
+        """
+        existing: dict = {name: (pos, size, mtime) for name, pos, size, mtime in self.db.execute(
+            "SELECT name, pos, size, mtime FROM media WHERE library = ? AND dir = ?", (self.library, path))}
+
+        gone: list = [existing[name][0] for name in existing.keys() - files.keys()]
+        modified: list = [(*files[name], self.library, pos)
+                          for name, (pos, size, mtime) in existing.items()
+                          if name in files and files[name] != (size, mtime)]
+        new: list = [name for name in files if name not in existing]
+
+        if not (gone or modified or new):
+            return None
+        self.changed = True
+
+        self.db.executemany("DELETE FROM media WHERE library = ? AND pos = ?",
+                            ((self.library, pos) for pos in gone))
+        self.holes += gone
+        self.db.executemany("UPDATE media SET size = ?, mtime = ? WHERE library = ? AND pos = ?", modified)
+
+        def rows():
+            for name in new:
+                if self.holes:
+                    pos: int = self.holes.pop()
+                else:
+                    pos = self.size
+                    self.size += 1
+                self.next_id += 1
+                yield (self.library, pos, self.next_id - 1, path, name, *files[name])
+
+        self.db.executemany("INSERT INTO media (library, pos, id, dir, name, size, mtime) "
+                            "VALUES (?, ?, ?, ?, ?, ?, ?)", rows())
+
+    def finish(self) -> None:
+        """
+        Move the last entries into the remaining holes and save the size
+        """
+        size: int = self.size - len(self.holes)
+        holes: list = sorted(pos for pos in self.holes if pos < size)
+        tail: list = [pos for (pos,) in self.db.execute(
+            "SELECT pos FROM media WHERE library = ? AND pos >= ? ORDER BY pos", (self.library, size))]
+
+        self.db.executemany("UPDATE media SET pos = ? WHERE library = ? AND pos = ?",
+                            ((hole, self.library, pos) for hole, pos in zip(holes, tail)))
+
+        self.size = size
+        self.holes = []
+        if self.changed:
+            self.db.execute("UPDATE libraries SET size = ?, next_id = ?, generation = generation + 1 "
+                            "WHERE id = ?", (size, self.next_id, self.library))
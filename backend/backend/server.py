@@ -0,0 +1,348 @@
+"""
+Long-lived scaffolding server
+
+Listens on a Unix socket (see client.socket_path) so editor plugins and
+scripts can create files without paying interpreter and import startup on
+every call. The tools and their templates stay loaded between requests.
+
+Every request is a single line of JSON, answered with lines of JSON:
+
+    {"op": "ping"}
+        -> {"ok": true, "pid": PID}
+
+    {"op": "create", "tool": "ctouch", "cwd": DIR, "names": [...],
+     "update": false, "overwrite": false, "jobs": 1}
+        -> {"ok": true, "results": [{"name": NAME, "file": FILE,
+                                     "outcome": OUTCOME}, ...],
+            "output": TEXT}
+
+       OUTCOME is "created", "unchanged", "failed" or "exists" (the file
+       was already there and overwrite was false).
+
+    {"op": "run", "tool": "ctouch", "argv": [...], "cwd": DIR, "umask": MASK}
+        -> any number of {"out": TEXT} and {"ask": PROMPT}, then {"exit": CODE}
+
+       Every {"ask": PROMPT} must be answered with {"answer": TEXT}.
+
+    {"op": "stop"}
+        -> {"ok": true}, then the server shuts down
+
+Errors are answered with {"ok": false, "error": MESSAGE}.
+
+Requests are run one at a time since the tools share the global Config,
+the working directory and stdout.
+"""
+import io
+import os
+import sys
+import json
+import socket
+import threading
+import importlib
+import contextlib
+import socketserver
+from .client import SERVED, socket_path, probe
+from .cli import TOOLS
+from .filemaker import FileMaker, Config
+from .journal import Journal
+
+# Tools that can be used with the "create" op
+CREATE: tuple = ("ctouch", "htouch", "pytouch")
+
+def strings(message: dict, key: str) -> list:
+    """
+    Args:
+        message (dict): a request
+        key      (str): field that should hold a list of strings
+
+    Returns:
+        list: The field's value
+
+    Raises:
+        TypeError: the field is not a list of strings (turned into "bad request")
+    """
+    value = message[key]
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise TypeError(f"'{key}' must be a list of strings")
+
+    return value
+
+class Relay:
+    def __init__(self, rfile, wfile):
+        """
+        File-like object sending whatever is written to it to the client
+
+        Args:
+            rfile (file): stream the client's answers are read from
+            wfile (file): stream messages are written to
+        """
+        self.rfile = rfile
+        self.wfile = wfile
+        self.closed: bool = False
+
+    def send(self, message: dict) -> None:
+        if self.closed:
+            return None
+
+        try:
+            self.wfile.write(json.dumps(message).encode() + b"\n")
+            self.wfile.flush()
+        except OSError:
+            self.closed = True
+
+    def write(self, text: str) -> int:
+        if text:
+            self.send({"out": text})
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+    def ask(self, prompt: str) -> str:
+        """
+        Ask the client to answer a prompt on its terminal
+
+        Raises:
+            KeyboardInterrupt: the client went away, which cancels the
+                               tool like a ^C at the prompt would
+        """
+        self.send({"ask": prompt})
+
+        line: bytes = b"" if self.closed else self.rfile.readline()
+        if not line:
+            self.closed = True
+            raise KeyboardInterrupt
+
+        return json.loads(line).get("answer", "")
+
+class CreateMaker(FileMaker):
+    def __init__(self, name: str, extension: str, overwrite: bool):
+        """
+        FileMaker answering overwrite prompts from the request
+
+        Args:
+            overwrite (bool): replace existing files instead of skipping them
+        """
+        super().__init__(name, extension)
+        self.overwrite: bool = overwrite
+        self.existing: set = set()
+
+    def confirm_overwrite(self, filename: str) -> bool:
+        if not self.overwrite:
+            self.existing.add(os.path.normpath(filename))
+
+        return self.overwrite
+
+class Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            op: str = None
+            line: bytes = self.rfile.readline()
+            if not line:
+                return None
+
+            message: dict = json.loads(line)
+            op = message.get("op")
+
+            if op == "ping":
+                reply: dict = {"ok": True, "pid": os.getpid()}
+            elif op == "create":
+                reply = self.server.create(message)
+            elif op == "run":
+                self.server.run(message, self.rfile, self.wfile)
+                return None
+            elif op == "stop":
+                reply = {"ok": True}
+            else:
+                reply = {"ok": False, "error": f"unknown op '{op}'"}
+        except (ValueError, KeyError, TypeError) as e:
+            reply = {"ok": False, "error": f"bad request: {e}"}
+        except OSError as e:
+            reply = {"ok": False, "error": str(e)}
+
+        try:
+            self.wfile.write(json.dumps(reply).encode() + b"\n")
+            self.wfile.flush()
+        except OSError:
+            pass
+
+        if reply.get("ok") and op == "stop":
+            self.server.shutdown()
+
+class Server(socketserver.ThreadingUnixStreamServer):
+    daemon_threads: bool = True
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): path of the socket to listen on
+        """
+        self.path: str = path
+        self.lock = threading.Lock()
+        self.defaults: dict = {name: getattr(Config, name)
+                               for name in ("VERBOSE", "JOBS", "STDIN_BUSY", "UPDATE", "ASK")}
+
+        # Only the owner may talk to the server, it writes files as them
+        umask: int = os.umask(0o177)
+        try:
+            super().__init__(path, Handler)
+        finally:
+            os.umask(umask)
+
+    def verify_request(self, request, client_address) -> bool:
+        peercred = getattr(socket, "SO_PEERCRED", None)
+        if peercred is None:
+            return True
+
+        import struct
+        creds: bytes = request.getsockopt(socket.SOL_SOCKET, peercred, struct.calcsize("3i"))
+        _, uid, _ = struct.unpack("3i", creds)
+        return uid == os.getuid()
+
+    @contextlib.contextmanager
+    def context(self, cwd: str, umask: int = None, ask=None):
+        """
+        Run a request in the client's directory with fresh tool state
+
+        Args:
+            cwd   (str): working directory of the client
+            umask (int): umask of the client, the server's if None
+            ask (callable): used to answer prompts, None to refuse them
+        """
+        with self.lock:
+            previous: str = os.getcwd()
+            old_umask: int = os.umask(umask if umask is not None else 0o022)
+            if umask is None:
+                os.umask(old_umask)
+
+            for name, value in self.defaults.items():
+                setattr(Config, name, value)
+            Config.RESULTS = Journal()
+            Config.ASK = ask if ask is not None else (lambda prompt: "n")
+
+            try:
+                os.chdir(cwd)
+                yield
+            finally:
+                Config.RESULTS.close()
+                os.chdir(previous)
+                os.umask(old_umask)
+                for name, value in self.defaults.items():
+                    setattr(Config, name, value)
+
+    def create(self, message: dict) -> dict:
+        """
+        Create files for one of the CREATE tools and report every outcome
+
+        Args:
+            message (dict): the "create" request
+
+        Returns:
+            dict: The reply
+        """
+        tool: str = message["tool"]
+        if tool not in CREATE:
+            return {"ok": False, "error": f"'{tool}' does not support create"}
+
+        module = importlib.import_module(TOOLS[tool])
+        names: list = strings(message, "names")
+        output = io.StringIO()
+
+        with self.context(message["cwd"]), contextlib.redirect_stdout(output):
+            Config.UPDATE = bool(message.get("update"))
+
+            FM = CreateMaker(tool, module.EXTENSION, bool(message.get("overwrite")))
+            outcomes = FM.iter_create(names, workers=int(message.get("jobs", 1)),
+                                      render=module.renderer())
+
+            results: list = []
+            for name, outcome in outcomes:
+                if outcome == "failed" and os.path.normpath(name) in FM.existing:
+                    outcome = "exists"
+                results.append({"name": name, "file": FM.target(name), "outcome": outcome})
+
+            FM.index.save()
+
+        return {"ok": True, "results": results, "output": output.getvalue()}
+
+    def run(self, message: dict, rfile, wfile) -> None:
+        """
+        Run a tool's main() for a client, relaying its output and prompts
+
+        Args:
+            message (dict): the "run" request
+            rfile   (file): stream the client's answers are read from
+            wfile   (file): stream the output is written to
+        """
+        argv: list = strings(message, "argv")
+        relay = Relay(rfile, wfile)
+
+        tool: str = message["tool"]
+        if tool not in SERVED:
+            relay.send({"out": f"[py_scripts] Error: '{tool}' cannot run on the server\n"})
+            relay.send({"exit": 2})
+            return None
+
+        module = importlib.import_module(TOOLS[tool])
+
+        code: int = 0
+        with self.context(message["cwd"], message.get("umask"), relay.ask), \
+             contextlib.redirect_stdout(relay):
+            try:
+                code = module.main(list(argv))
+            except SystemExit as e:
+                code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            except Exception as e:
+                print(f"[{tool}] Error: {e}")
+                code = 1
+
+        relay.send({"exit": code or 0})
+
+def serve(path: str = None) -> int:
+    """
+    Run the server until it is stopped
+
+    Args:
+        path (str): socket to listen on, see client.socket_path
+
+    Returns:
+        int: The exit status
+    """
+    path = path or socket_path()
+
+    # Not connect(): PY_SCRIPTS_NO_SERVER must not hide a running server here
+    sock = probe(path)
+    if sock is not None:
+        sock.close()
+        print(f"[py_scripts] Error: a server is already listening on {path}")
+        return 1
+
+    try:
+        os.unlink(path)  # left behind by a server that did not exit cleanly
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        print(f"[py_scripts] Error: could not remove {path}: {e}")
+        return 1
+
+    # Load the templates and tools once, before the first request
+    from .templates import TEMPLATES
+    for tool in SERVED:
+        importlib.import_module(TOOLS[tool])
+    for name in ("c", "h", "py", "makefile", "package"):
+        TEMPLATES.get(name)
+
+    server = Server(path)
+    print(f"py_scripts: serving on {path}")
+    sys.stdout.flush()
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(path)
+
+    return 0
@@ -0,0 +1,237 @@
+import os
+import struct
+from array import array
+from random import randrange, shuffle
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+MAGIC: bytes = b"PSBG"
+VERSION: int = 2
+
+# magic, version, cursor, number of entries, number of libraries
+HEADER = struct.Struct("=4sIQQI4x")
+COVERED = struct.Struct("=Q")
+ENTRY = struct.Struct("=Q")
+
+class ShuffleBag:
+    def __init__(self, path: str, libraries: int):
+        """
+        Persistent no-repeat shuffle of the entries of one or more libraries
+
+        The file holds a permutation of (library, id) entries and a cursor.
+        It is memory-mapped, so a pick reads a single entry and moves the
+        cursor without reading the rest of the file. Every entry comes up
+        once before the bag is shuffled again.
+
+        Ids are never reused, so an entry that was played stays played
+        whatever happens to the library. When a library gains ids, they are
+        spread over the part of the bag that was not played yet. Entries
+        that are gone are skipped when they come up.
+
+        Args:
+            path      (str): file holding the bag
+            libraries (int): number of libraries the bag covers
+        """
+        self.path: str = path
+        self.libraries: int = libraries
+        self.file = None
+        self.map = None
+
+    def open(self) -> None:
+        import mmap
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.file = open(self.path, "a+b")
+        if fcntl is not None:
+            fcntl.flock(self.file, fcntl.LOCK_EX)
+
+        if not self.valid():
+            self.write([0] * self.libraries, array("Q"))
+
+        self.map = mmap.mmap(self.file.fileno(), 0)
+
+    def valid(self) -> bool:
+        """
+        Returns:
+            bool: True if the file holds a bag for this number of libraries
+        """
+        self.file.seek(0)
+        header: bytes = self.file.read(HEADER.size)
+        if len(header) != HEADER.size:
+            return False
+
+        magic, version, _, length, libraries = HEADER.unpack(header)
+        expected: int = HEADER.size + COVERED.size * libraries + ENTRY.size * length
+
+        return (magic == MAGIC and version == VERSION and libraries == self.libraries
+                and os.fstat(self.file.fileno()).st_size == expected)
+
+    def write(self, covered: list, entries: array) -> None:
+        """
+        Replace the whole bag, with the cursor back at the start
+
+        Args:
+            covered  (list): next id of every library the entries were made from
+            entries (array): the entries, already shuffled
+        """
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+
+        self.file.truncate(0)
+        self.file.seek(0)
+        self.file.write(HEADER.pack(MAGIC, VERSION, 0, len(entries), self.libraries))
+        self.file.write(b"".join(COVERED.pack(size) for size in covered))
+        self.file.write(entries.tobytes())
+        self.file.flush()
+
+    @property
+    def start(self) -> int:
+        return HEADER.size + COVERED.size * self.libraries
+
+    def header(self) -> tuple:
+        """
+        Returns:
+            tuple: (cursor, number of entries)
+        """
+        _, _, cursor, length, _ = HEADER.unpack_from(self.map, 0)
+        return cursor, length
+
+    def set_header(self, cursor: int, length: int) -> None:
+        HEADER.pack_into(self.map, 0, MAGIC, VERSION, cursor, length, self.libraries)
+
+    def covered(self) -> list:
+        return [COVERED.unpack_from(self.map, HEADER.size + COVERED.size * a)[0]
+                for a in range(self.libraries)]
+
+    def entry(self, index: int) -> int:
+        return ENTRY.unpack_from(self.map, self.start + ENTRY.size * index)[0]
+
+    def set_entry(self, index: int, value: int) -> None:
+        ENTRY.pack_into(self.map, self.start + ENTRY.size * index, value)
+
+    def refill(self, heads: list, ids) -> None:
+        """
+        Shuffle every entry of the libraries into a new bag
+
+        Args:
+            heads   (list): next id of every library
+            ids (callable): ids(library, start) -> ids of its entries from start on
+        """
+        entries = array("Q")
+        for library in range(self.libraries):
+            entries.extend((library << 32) | id for id in ids(library, 0))
+        shuffle(entries)
+
+        self.write(heads, entries)
+        self.remap()
+
+    def grow(self, heads: list, ids) -> None:
+        """
+        Spread the ids a library gained over the unplayed part of the bag
+
+        Args:
+            heads   (list): next id of every library
+            ids (callable): ids(library, start) -> ids of its entries from start on
+        """
+        covered: list = self.covered()
+        if heads == covered:
+            return None
+
+        # Ids only go down when the index was rebuilt, nothing in the bag is valid then
+        if any(head < known for head, known in zip(heads, covered)):
+            self.refill(heads, ids)
+            return None
+
+        new: list = [(library << 32) | id
+                     for library, (head, known) in enumerate(zip(heads, covered)) if head > known
+                     for id in ids(library, known)]
+
+        cursor, length = self.header()
+        tail = array("Q")
+
+        # Inside-out Fisher-Yates over the unplayed entries [cursor, length + len(tail))
+        for value in new:
+            total: int = length + len(tail)
+            j: int = randrange(cursor, total + 1)
+            if j == total:
+                tail.append(value)
+            elif j < length:
+                tail.append(self.entry(j))
+                self.set_entry(j, value)
+            else:
+                tail.append(tail[j - length])
+                tail[j - length] = value
+
+        for library, head in enumerate(heads):
+            COVERED.pack_into(self.map, HEADER.size + COVERED.size * library, head)
+        self.set_header(cursor, length + len(tail))
+        self.map.flush()
+
+        self.file.seek(0, os.SEEK_END)
+        self.file.write(tail.tobytes())
+        self.file.flush()
+        self.remap()
+
+    def remap(self) -> None:
+        import mmap
+
+        if self.map is not None:
+            self.map.close()
+        self.map = mmap.mmap(self.file.fileno(), 0)
+
+    def next(self, heads: list, ids, position) -> tuple:
+        """
+        Take the next entry out of the bag
+
+        Args:
+            heads        (list): next id of every library
+            ids      (callable): ids(library, start) -> ids of its entries from start on
+            position (callable): position(library, id) -> where the entry is now,
+                                 None if it is gone
+
+        Returns:
+            tuple: (library, position), None if every library is empty
+        """
+        if not any(heads):
+            return None
+
+        self.grow(heads, ids)
+        refilled: bool = False
+
+        while True:
+            cursor, length = self.header()
+            if cursor >= length:
+                # Everything in a fresh bag was gone already, the libraries are empty
+                if refilled:
+                    return None
+                self.refill(heads, ids)
+                refilled = True
+                continue
+
+            value: int = self.entry(cursor)
+            self.set_header(cursor + 1, length)
+
+            library, id = value >> 32, value & 0xffffffff
+            if library < len(heads):
+                pos: int = position(library, id)
+                if pos is not None:
+                    return library, pos
+
+    def close(self) -> None:
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,331 @@
+import os
+import re
+
+# Slots look like {{name}} so C braces and make variables pass through as-is
+SLOT = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+# Build profiles understood by the makefile template
+PROFILES: tuple = ("debug", "release", "lto", "pgo")
+
+BUILTIN: dict = {
+    "c": """#include <stdio.h>
+
+int main(int argc, char *argv[]) {
+    printf("Hello, World!\\n");
+
+    return 0;
+}""",
+
+    "h": """#ifndef {{guard}}
+#define {{guard}}
+
+{{body}}#endif
+""",
+
+    "py": """# -*- coding: utf-8 -*-
+\"\"\"
+{{name}}
+==============
+
+Brief desription of the program.
+
+Detailed description of the program explaining simple functions.
+
+Author: Riley Ava
+Created: {{date}}
+Last Modified: {{date}}
+Version: 1.0.0
+License: MPL 2.0
+Repository: https://github.com/RileyMeta/{{name}}
+
+Requirements:
+    - Python 3.10 (or newer)
+
+Usage:
+    {{name}} [option] FILE...
+
+Copyright (c) {{year}} Riley Ava
+\"\"\"
+""",
+
+    "readme": """# {{name}}""",
+
+    "package": """# -*- coding: utf-8 -*-
+\"\"\"
+{{name}}
+==============
+
+Brief description of the package.
+
+Author: Riley Ava
+Created: {{date}}
+License: MPL 2.0
+
+Copyright (c) {{year}} Riley Ava
+\"\"\"
+# Lazy submodule loading generated by pytouch, __all__ is rewritten on every run
+import importlib
+
+__all__ = [{{modules}}]
+
+def __getattr__(name: str):
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
+""",
+
+    "makefile": """TARGET = {{name}}
+SRC := $(wildcard src/*.c)
+
+# Build profile: debug, release, lto or pgo (make PROFILE=debug)
+PROFILE ?= {{profile}}
+BUILD = build/$(PROFILE)
+BIN := $(BUILD)/$(TARGET)
+OBJ := $(SRC:src/%.c=$(BUILD)/%.o)
+DEP := $(OBJ:.o=.d)
+
+# Compiler and Flags
+CC = gcc
+CFLAGS = -Wall -std=c99 -Wno-missing-braces -Iinclude
+DEPFLAGS = -MMD -MP
+
+# Compile through ccache when it is installed (make USE_CCACHE=0 to disable)
+USE_CCACHE ?= {{ccache}}
+ifeq ($(USE_CCACHE),1)
+    CCACHE := $(shell command -v ccache 2>/dev/null)
+    ifneq ($(CCACHE),)
+        CC := $(CCACHE) $(CC)
+    endif
+endif
+
+ifeq ($(PROFILE),debug)
+    CFLAGS += -O0 -g
+else ifeq ($(PROFILE),release)
+    CFLAGS += -O2 -DNDEBUG
+else ifeq ($(PROFILE),lto)
+    CFLAGS += -O2 -DNDEBUG -flto
+    LDFLAGS += -flto
+else ifeq ($(PROFILE),pgo)
+    # Stage is switched by the pgo target: generate, run, then use
+    PGO_STAGE ?= use
+    ifeq ($(PGO_STAGE),generate)
+        CFLAGS += -O2 -DNDEBUG -fprofile-generate
+        LDFLAGS += -fprofile-generate
+    else
+        CFLAGS += -O2 -DNDEBUG -fprofile-use -fprofile-correction -Wno-missing-profile
+    endif
+else
+    $(error Unknown PROFILE '$(PROFILE)', use debug, release, lto or pgo)
+endif
+
+# Precompiled header: include/pch.h is compiled once per profile and
+# force-included in every source (make USE_PCH=0 to disable)
+USE_PCH ?= {{pch}}
+PCH_SRC = include/pch.h
+PCH_DIR = $(BUILD)/pch
+PCH_OUT = $(PCH_DIR)/pch.h.gch
+ifeq ($(USE_PCH)$(wildcard $(PCH_SRC)),1$(PCH_SRC))
+    PCH_FLAGS = -I$(PCH_DIR) -include pch.h
+    PCH_DEP = $(PCH_OUT)
+endif
+
+# Libraries and linking
+# LIBS = -lraylib -lGL -lm -lpthread -ldl -lrt -lX11
+
+# Link rule
+$(BIN): $(OBJ)
+	$(CC) $(OBJ) -o $(BIN) $(LDFLAGS) $(LIBS)
+
+# Compile rule, one object per source so only what changed is rebuilt
+$(BUILD)/%.o: src/%.c $(PCH_DEP) | $(BUILD)
+	$(CC) $(PCH_FLAGS) $(CFLAGS) $(DEPFLAGS) -c $< -o $@
+
+$(BUILD):
+	mkdir -p $(BUILD)
+
+# Rebuilt only when pch.h or one of the headers it includes changes
+$(PCH_OUT): $(PCH_SRC)
+	mkdir -p $(PCH_DIR)
+	$(CC) $(CFLAGS) $(DEPFLAGS) -x c-header -c $< -o $@
+
+# Unity build: src/*.c concatenated into UNITY_GROUPS translation units
+UNITY_GROUPS ?= {{unity}}
+UNITY_DIR = $(BUILD)/unity
+ifneq ($(UNITY_GROUPS),0)
+UNITY_SRC := $(foreach i,$(shell seq 1 $(UNITY_GROUPS)),$(UNITY_DIR)/unity_$(i).c)
+UNITY_OBJ := $(UNITY_SRC:.c=.o)
+
+unity: $(UNITY_DIR)/$(TARGET)
+
+$(UNITY_DIR)/$(TARGET): $(UNITY_OBJ)
+	$(CC) $(UNITY_OBJ) -o $@ $(LDFLAGS) $(LIBS)
+
+$(UNITY_DIR)/%.o: $(UNITY_DIR)/%.c $(PCH_DEP)
+	$(CC) $(PCH_FLAGS) $(CFLAGS) $(DEPFLAGS) -c $< -o $@
+
+$(UNITY_SRC): $(UNITY_DIR)/sources ;
+
+# Sources are dealt round-robin into the groups, a group file is only
+# rewritten when its list of sources changes
+$(UNITY_DIR)/sources: $(SRC) Makefile
+	mkdir -p $(UNITY_DIR)
+	rm -f $(UNITY_DIR)/*.tmp
+	@i=0; for f in $(SRC); do \\
+		echo '#include "../../../'$$f'"' >> $(UNITY_DIR)/unity_$$((i % $(UNITY_GROUPS) + 1)).c.tmp; \\
+		i=$$((i + 1)); \\
+	done
+	@for f in $(UNITY_SRC); do \\
+		touch $$f.tmp; \\
+		cmp -s $$f.tmp $$f && rm $$f.tmp || mv $$f.tmp $$f; \\
+	done
+	echo $(SRC) > $@
+else
+unity:
+	@echo "Unity builds are disabled, try: make unity UNITY_GROUPS=4"
+	@false
+endif
+
+# Profile guided build: instrument, run with PGO_ARGS, rebuild with the profile
+pgo:
+	rm -rf build/pgo
+	$(MAKE) PROFILE=pgo PGO_STAGE=generate
+	./build/pgo/$(TARGET) $(PGO_ARGS)
+	rm -f build/pgo/*.o build/pgo/$(TARGET)
+	$(MAKE) PROFILE=pgo PGO_STAGE=use
+
+# Clean rule
+clean:
+	rm -rf build
+
+# Run rule
+run: $(BIN)
+	./$(BIN)
+
+.PHONY: unity pgo clean run
+
+# Header dependencies generated by -MMD
+-include $(DEP) $(UNITY_OBJ:.o=.d) $(PCH_OUT:.gch=.d)
+""",
+}
+
+class Template:
+    def __init__(self, source: str):
+        """
+        Compile a template once into its literal text and slot names
+
+        Args:
+            source (str): template text with {{slot}} placeholders
+        """
+        parts: list = SLOT.split(source)
+        self.source: str = source
+        self.literals: tuple = tuple(parts[0::2])
+        self.slots: tuple = tuple(parts[1::2])
+
+    def render(self, **values) -> str:
+        """
+        Fill in the slots of the template
+
+        Slots without a value are left in the output untouched.
+
+        Returns:
+            str: The rendered file contents
+        """
+        out: list = [self.literals[0]]
+        for slot, literal in zip(self.slots, self.literals[1:]):
+            out.append(str(values[slot]) if slot in values else f"{{{{{slot}}}}}")
+            out.append(literal)
+
+        return "".join(out)
+
+class TemplateRegistry:
+    def __init__(self, directory: str = None):
+        """
+        Look up templates by name, preferring user files over the builtins
+
+        User templates live in DIRECTORY/<name>.tmpl, by default
+        $XDG_CONFIG_HOME/py_scripts/templates (~/.config/py_scripts/templates).
+
+        Args:
+            directory (str): directory holding the user templates
+        """
+        if directory is None:
+            config: str = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+            directory = os.path.join(config, "py_scripts", "templates")
+
+        self.directory: str = directory
+        self.cache: dict = {}
+        self.values: dict = None
+        self.day = None
+
+    def get(self, name: str) -> Template:
+        """
+        Get a compiled template, recompiling it only if its file changed
+
+        Args:
+            name (str): name of the template (c, h, py, makefile, ...)
+
+        Returns:
+            Template: The compiled template
+        """
+        path: str = os.path.join(self.directory, f"{name}.tmpl")
+
+        try:
+            mtime: int = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        cached: tuple = self.cache.get(name)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        if mtime is None:
+            source: str = BUILTIN[name]
+        else:
+            with open(path, 'r') as f:
+                source = f.read()
+
+        template: Template = Template(source)
+        self.cache[name] = (mtime, template)
+        return template
+
+    def defaults(self) -> dict:
+        """
+        Values shared by every file rendered on the same day
+
+        They are worked out again once the date changes, so a long running
+        process (like the server) does not keep stamping yesterday's date.
+
+        Returns:
+            dict: The date and year slots
+        """
+        from datetime import date
+
+        today = date.today()
+        if self.values is None or self.day != today:
+            self.day = today
+            self.values = {
+                "date": today.strftime("%d/%m/%Y"),
+                "year": today.year,
+            }
+
+        return self.values
+
+    def render(self, template: str, **values) -> str:
+        """
+        Render a template by name with the shared default values
+
+        Args:
+            template (str): name of the template
+
+        Returns:
+            str: The rendered file contents
+        """
+        return self.get(template).render(**{**self.defaults(), **values})
+
+TEMPLATES: TemplateRegistry = TemplateRegistry()
@@ -0,0 +1,6 @@
+"""
+Command line tools built on top of the backend, one module per program.
+
+Each module exposes main(argv) -> int and only imports what it uses, so
+the dispatcher in backend.cli can load a single tool per run.
+"""
@@ -0,0 +1,444 @@
+# -*- coding: utf-8 -*-
+"""
+cproject
+==============
+
+Create a templated C project folder.
+
+Create a C project folder with a src, lib and include folder, a main.c and a Makefile.
+
+Author: Riley Ava
+Created: 21/01/2026
+Last Modified: 21/01/2026
+Version: 1.0.0
+License: MPL 2.0
+Repository: https://github.com/RileyMeta/py_scripts
+
+Requirements:
+    - Python 3.10 (or newer)
+
+Usage:
+    cproject [option] FILE...
+
+Copyright (c) 2026 Riley Ava
+"""
+import getopt
+import os, sys
+import threading
+from time import perf_counter
+from backend import FileMaker, Config, TEMPLATES, PROFILES, clone_tree, cache_dir
+from backend import remove_tree, move_to_trash, exchange, fsync_path, fsync_tree
+
+# Umbrella header contents, add the project's own heavy includes to it
+PCH_HEADERS: tuple = ("stdio.h", "stdlib.h", "string.h", "stdint.h", "stdbool.h")
+
+class Cproject:
+    def __init__(self):
+        self.projects: list = []
+        self.FM = FileMaker("cproject", "")
+        self.FM.noun = "project"
+        self.timings: dict = {}
+        self.lock = threading.Lock()
+        self.use_cache: bool = False
+        self.background: bool = False
+        self.deleters: list = []
+        self.durability: str = "batch"
+        self.profile: str = "release"
+        self.ccache: int = 0
+        self.unity: int = 0
+        self.pch: int = 0
+        self.umask: int = os.umask(0)
+        os.umask(self.umask)
+        self.skeleton_dir: str = ""
+
+    def timed(self, phase: str, func, *args):
+        """
+        Run one phase of the project creation and add up its time
+
+        Args:
+            phase    (str): name of the phase
+            func (callable): the phase itself
+        """
+        start: float = perf_counter()
+        try:
+            return func(*args)
+        finally:
+            elapsed: float = perf_counter() - start
+            with self.lock:
+                self.timings[phase] = self.timings.get(phase, 0.0) + elapsed
+
+    def create_projects(self, workers: int = 1):
+        """
+        Create every project, up to `workers` of them at the same time
+
+        Overwrites are all confirmed before anything is built so prompts
+        never interleave, and outcomes are recorded in the given order.
+
+        Args:
+            workers (int): number of projects built at once
+        """
+        jobs: list = []
+        for project in self.projects:
+            overwrite: bool = False
+
+            # If the directory already exists
+            if os.path.isdir(project):
+                if self.confirm_overwrite(project):
+                    overwrite = True
+                else:
+                    Config.RESULTS.record("failed", project)
+                    continue # skip to the next item
+
+            jobs.append((project, overwrite))
+
+        if workers <= 1 or len(jobs) <= 1:
+            errors: list = list(map(self.create_project, jobs))
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                errors: list = list(pool.map(self.create_project, jobs))
+
+        for (project, _), error in zip(jobs, errors):
+            if error is None:
+                Config.RESULTS.record("created", project)
+            else:
+                Config.RESULTS.record("failed", project)
+                print(f"[cproject] Error: {error}")
+
+    def create_project(self, job: tuple) -> str:
+        """
+        Build a single project tree in-process (safe to run from worker threads)
+
+        The tree is built in a hidden staging directory next to the project
+        and published with a single rename, so an interrupted run never
+        leaves a half-built project behind.
+
+        Args:
+            job (tuple): (path of the project folder, overwrite it first)
+
+        Returns:
+            str: The error message, None on success
+        """
+        project, overwrite = job
+        project = os.path.normpath(project)
+        parent, name = os.path.split(project)
+        staging: str = ""
+        from tempfile import mkdtemp
+
+        try:
+            os.makedirs(parent or ".", exist_ok=True)
+            self.report_leftovers(parent or ".", name)
+            staging = mkdtemp(prefix=f".{name}.stage-", dir=parent or ".")
+            os.chmod(staging, 0o777 & ~self.umask)
+
+            if self.use_cache:
+                self.timed("skeleton", self.clone_skeleton, staging)
+            else:
+                self.timed("folders", self.create_folders, staging)
+                self.timed("main.c", self.create_mainsrc, staging)
+
+            self.timed("readme", self.create_readme, staging, name)
+            self.timed("makefile", self.create_makefile, staging, name)
+
+            if self.pch:
+                self.timed("pch.h", self.create_pch, staging)
+
+            # Strict already flushed every file as it was written
+            if self.durability != "none":
+                self.timed("fsync", fsync_tree, staging, self.durability != "strict")
+
+            self.timed("publish", self.publish, staging, project, overwrite)
+        except OSError as e:
+            if staging:
+                from shutil import rmtree
+                rmtree(staging, ignore_errors=True)
+            return str(e)
+
+        return None
+
+    def publish(self, staging: str, project: str, overwrite: bool):
+        """
+        Swap a finished staging directory into place
+
+        An existing project is swapped with the staging directory in one
+        renameat2(RENAME_EXCHANGE) call where the system supports it.
+        Otherwise it is moved out of the way first, and put back if the
+        staging directory can't be renamed. A run killed between those two
+        renames leaves the old project in a .NAME.trash-* directory, which
+        the next run reports.
+
+        Args:
+            staging    (str): the finished project tree
+            project    (str): where the project should end up
+            overwrite (bool): replace the existing project
+        """
+        if overwrite and os.path.lexists(project) and exchange(staging, project):
+            # The staging directory now holds the old project
+            if self.durability != "none":
+                fsync_path(os.path.dirname(project) or ".")
+            self.clean(staging)
+            return None
+
+        trash: str = move_to_trash(project) if overwrite else ""
+
+        try:
+            os.rename(staging, project)
+        except OSError as e:
+            if not trash:
+                raise
+
+            try:
+                os.rename(trash, project)
+            except OSError:
+                raise OSError(f"{e}, the old project was kept in {trash}") from e
+            raise
+        if self.durability != "none":
+            fsync_path(os.path.dirname(project) or ".")
+
+        if trash:
+            self.clean(trash)
+
+    def report_leftovers(self, parent: str, name: str):
+        """
+        Point out what interrupted runs left next to a project
+
+        Args:
+            parent (str): folder holding the project
+            name   (str): name of the project
+        """
+        prefixes: tuple = (f".{name}.trash-", f".{name}.stage-")
+        with os.scandir(parent) as entries:
+            for entry in entries:
+                if entry.name.startswith(prefixes) and entry.is_dir(follow_symlinks=False):
+                    print(f"[cproject] Warning: {entry.path} was left behind by an interrupted run")
+
+    def confirm_overwrite(self, name: str) -> bool:
+        prompt: str = f"{name} already exists.\n"
+        prompt += "Would you like to overwrite it?\n"
+        prompt += "[NOTE!] This will delete the folder and it's contents."
+
+        try:
+            while True:
+                print(prompt)
+                response = self.FM.ask("[Y]es or [N]o: ").lower()
+                if response in ("y", "yes"):
+                    return True
+                elif response in ("n", "no"):
+                    return False
+                else:
+                    print(f"{response} is not recognized.")
+                    self.FM.pause()
+                    continue
+        except KeyboardInterrupt:
+            print("\nOperation was cancelled.")
+            sys.exit(-1)
+
+    def clean(self, trash: str):
+        if not self.background:
+            self.timed("clean", self.remove_trash, trash)
+            return None
+
+        # Delete the old project while the remaining projects are built
+        deleter = threading.Thread(target=self.remove_trash, args=(trash,))
+        deleter.start()
+
+        with self.lock:
+            self.deleters.append(deleter)
+
+    def remove_trash(self, trash: str):
+        try:
+            remove_tree(trash)
+        except OSError as e:
+            print(f"[cproject] Error: could not remove {trash}: {e}")
+
+    def wait_for_deleters(self):
+        if self.deleters:
+            self.timed("clean wait", lambda: [d.join() for d in self.deleters])
+
+    def write(self, path: str, content: str):
+        error: str = self.FM.write_file(path, content)
+        if error is not None:
+            raise OSError(error)
+
+        if self.durability == "strict":
+            fsync_path(path)
+
+    def create_folders(self, name: str):
+        for sub_dir in ("lib", "include", "src"):
+            os.makedirs(os.path.join(name, sub_dir), exist_ok=True)
+
+    def create_makefile(self, project: str, name: str):
+        makefile: str = TEMPLATES.render("makefile", name=name, profile=self.profile,
+                                         ccache=self.ccache, unity=self.unity,
+                                         pch=self.pch)
+        self.write(f"{project}/Makefile", makefile)
+
+    def create_mainsrc(self, project: str):
+        self.write(f"{project}/src/main.c", TEMPLATES.render("c"))
+
+    def create_pch(self, project: str):
+        body: str = "".join(f"#include <{header}>\n" for header in PCH_HEADERS) + "\n"
+        self.write(f"{project}/include/pch.h",
+                   TEMPLATES.render("h", name="pch", guard="PCH_H", body=body))
+
+    def create_readme(self, project: str, name: str):
+        self.write(f"{project}/README.md", TEMPLATES.render("readme", name=name))
+
+    def skeleton(self) -> str:
+        """
+        Get the cached golden skeleton, building it the first time
+
+        The skeleton holds everything that does not depend on the project
+        name and is keyed by a hash of its contents, so editing a template
+        starts a new one.
+
+        Returns:
+            str: Path of the skeleton directory
+        """
+        with self.lock:
+            if self.skeleton_dir:
+                return self.skeleton_dir
+
+            from hashlib import sha256
+            main_src: str = TEMPLATES.render("c")
+            key: str = sha256(main_src.encode()).hexdigest()[:16]
+            skeleton: str = cache_dir("skeleton", key)
+
+            if not os.path.isdir(skeleton):
+                os.makedirs(os.path.dirname(skeleton), exist_ok=True)
+                staging: str = f"{skeleton}.{os.getpid()}.tmp"
+                self.create_folders(staging)
+                self.create_mainsrc(staging)
+
+                try:
+                    os.rename(staging, skeleton)
+                except OSError:
+                    # Another run published the same skeleton first
+                    from shutil import rmtree
+                    rmtree(staging, ignore_errors=True)
+
+            self.skeleton_dir = skeleton
+            return skeleton
+
+    def clone_skeleton(self, project: str):
+        clone_tree(self.skeleton(), project)
+
+        if self.durability == "strict":
+            fsync_tree(project)
+
+    def finish(self):
+        self.wait_for_deleters()
+        self.FM.finish()
+
+        if Config.VERBOSE and self.timings:
+            total: float = sum(self.timings.values())
+            lines: list = [f"  {phase:<10}{seconds * 1000:10.2f} ms\n"
+                           for phase, seconds in self.timings.items()]
+            lines.append(f"  {'total':<10}{total * 1000:10.2f} ms\n")
+            sys.stdout.write("cproject: time per phase\n" + "".join(lines))
+
+def usage():
+    print("Usage: cproject [option] FILE...")
+
+def help_menu():
+    usage()
+    print("""Generated a templated C project folder
+
+  -v, --verbose   Print more for debugging
+  -p, --profile=NAME
+                  default build profile: debug, release (default), lto or pgo
+      --ccache    compile through ccache when it is installed
+      --unity=N   add a unity build target merging the sources into N files
+      --pch       build include/pch.h as a precompiled header for every source
+  -j, --jobs=N    create up to N projects at once
+  -c, --cache     clone the project skeleton from ~/.cache/py_scripts
+  -b, --background
+                  delete overwritten projects in the background
+      --durability=MODE
+                  none, batch (default, fsync once before publishing)
+                  or strict (fsync every file as it is written)
+
+  -h, --help      display this help menu and exit
+  -V, --version   display version information and exit
+
+Report bugs to: <https://github.com/RileyMeta/py_scripts/pulls>""")
+
+def version_menu():
+    print(f"""cproject (C Project) 1.0.0
+Copyright (C) 2026 Riley Ava.
+License MPL2.0: Mozilla Public License 2.0 <https://www.mozilla.org/en-US/MPL/2.0/>.
+This is free software: you are free to change and redistribute it.
+There is NO WARRANTY, to the extent permitted by law.
+
+Written by Riley Ava.""")
+
+def main(argv: list = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    short_opts = "Vvj:cbp:"
+    long_opts = ["help", "version", "verbose", "jobs=", "cache", "background",
+                 "durability=", "profile=", "ccache", "unity=",
+                 "pch"]
+
+    try:
+        opts, args = getopt.getopt(argv, short_opts, long_opts)
+    except getopt.GetoptError as e:
+        print(str(e))
+        sys.exit(2)
+
+    C = Cproject()
+
+    for opt, arg in opts:
+        if opt in ("--help"):
+            help_menu()
+            sys.exit(0)
+        elif opt in ("-V", "--version"):
+            version_menu()
+            sys.exit(0)
+        elif opt in ("-v", "--verbose"):
+            Config.VERBOSE = True
+        elif opt in ("-j", "--jobs"):
+            try:
+                Config.JOBS = int(arg)
+            except ValueError:
+                print(f"cproject: invalid number of jobs: {arg}")
+                sys.exit(2)
+        elif opt in ("-c", "--cache"):
+            C.use_cache = True
+        elif opt in ("-b", "--background"):
+            C.background = True
+        elif opt == "--durability":
+            if arg not in ("none", "batch", "strict"):
+                print(f"cproject: invalid durability: {arg}")
+                sys.exit(2)
+            C.durability = arg
+        elif opt in ("-p", "--profile"):
+            if arg not in PROFILES:
+                print(f"cproject: invalid profile: {arg}")
+                sys.exit(2)
+            C.profile = arg
+        elif opt == "--ccache":
+            C.ccache = 1
+        elif opt == "--unity":
+            try:
+                C.unity = int(arg)
+                if C.unity < 0:
+                    raise ValueError(arg)
+            except ValueError:
+                print(f"cproject: invalid number of unity files: {arg}")
+                sys.exit(2)
+        elif opt == "--pch":
+            C.pch = 1
+
+    if not args:
+        usage()
+        sys.exit(1)
+
+    for arg in args:
+        C.projects.append(arg)
+
+    C.create_projects(workers=Config.JOBS)
+    C.finish()
+
+    return 0
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Ctouch
+==============
+
+Touch a C file into existence.
+
+Generate a templated C file or list of files.
+
+Author: Riley Ava
+Created: 19-01-2026
+Last Modified: 20-01-2026
+Version: 1.0.0
+License: MPL 2.0
+Repository: https://github.com/RileyMeta/py_scripts
+
+Requirements:
+    - Python 3.10 (or newer)
+
+Usage:
+    ctouch [option] FILE...
+
+Copyright (c) 2026 Riley Ava
+"""
+import os, sys
+import getopt
+from backend import FileMaker, Config, iter_names, TEMPLATES
+
+EXTENSION: str = ".c"
+
+def renderer():
+    """
+    Returns:
+        callable: Renders the contents of a new file from its name
+    """
+    content: str = TEMPLATES.render("c")
+    return lambda _: content
+
+def usage():
+    print("Usage: ctouch [option] FILE...")
+
+def help_menu():
+    usage()
+    print("""Generated a templated C file
+
+  -v, --verbose   Print more for debugging
+  -j, --jobs=N    create up to N files at once
+  -u, --update    only rewrite files whose contents would change
+      --from-file=FILE
+                  read names from FILE, one per line ('-' for stdin)
+  -0, --null      names in FILE are separated by NUL instead of newline
+      --journal=FILE
+                  write the outcome of every file to FILE
+
+  -h, --help      display this help menu and exit
+  -V, --version   display version information and exit
+
+Report bugs to: <https://github.com/RileyMeta/py_scripts/pulls>""")
+
+def version_menu():
+    print(f"""ctouch (C Touch) 1.0.0
+Copyright (C) 2026 Riley Ava.
+License MPL2.0: Mozilla Public License 2.0 <https://www.mozilla.org/en-US/MPL/2.0/>.
+This is free software: you are free to change and redistribute it.
+There is NO WARRANTY, to the extent permitted by law.
+
+Written by Riley Ava.""")
+
+def main(argv: list = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    short_opts = "Vvj:0u"
+    long_opts = ["help", "version", "verbose", "jobs=", "from-file=", "null",
+                 "journal=", "update"]
+
+    try:
+        opts, args = getopt.getopt(argv, short_opts, long_opts)
+    except getopt.GetoptError as e:
+        print(str(e))
+        sys.exit(2)
+
+    manifests: list = []
+    separator: bytes = b"\n"
+
+    for opt, arg in opts:
+        if opt in ("--help"):
+            help_menu()
+            sys.exit(0)
+        elif opt in ("-V", "--version"):
+            version_menu()
+            sys.exit(0)
+        elif opt in ("-v", "--verbose"):
+            Config.VERBOSE = True
+        elif opt in ("-j", "--jobs"):
+            try:
+                Config.JOBS = int(arg)
+            except ValueError:
+                print(f"ctouch: invalid number of jobs: {arg}")
+                sys.exit(2)
+        elif opt == "--from-file":
+            manifests.append(arg)
+        elif opt in ("-0", "--null"):
+            separator = b"\0"
+        elif opt in ("-u", "--update"):
+            Config.UPDATE = True
+        elif opt == "--journal":
+            Config.RESULTS.open(arg)
+
+    if not args and not manifests:
+        usage()
+        sys.exit(1)
+
+    FM = FileMaker("ctouch", EXTENSION)
+
+    names = iter_names(args, manifests, separator)
+    FM.create_files(names, workers=Config.JOBS, render=renderer())
+
+    FM.finish()
+
+    return 0
@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+"""
+Htouch
+==============
+
+Generate a templated C Header file.
+
+Create a C Header file with the basic ifndef and define flags set based on the names provided.
+
+Author: Riley Ava
+Created: 20-01-2026
+Last Modified: 21-01-2026
+Version: 1.0.0
+License: MPL 2.0
+Repository: https://github.com/RileyMeta/py_scripts
+
+Requirements:
+    - Python 3.10 (or newer)
+
+Usage:
+    htouch [option] FILE...
+
+Copyright (c) 2026 Riley Ava
+"""
+import os, sys
+import getopt
+from backend import FileMaker, Config, iter_names, TEMPLATES
+from backend import scan_tree, DeclarationCache
+from backend import audit, guard_for, rewrite_guard
+from backend.guards import IDENTIFIER
+
+EXTENSION: str = ".h"
+
+def renderer(bodies: dict = None):
+    """
+    Args:
+        bodies (dict): header name -> declarations to put in its body
+
+    Returns:
+        callable: Renders the contents of a new header from its name
+    """
+    template = TEMPLATES.get("h")
+    defaults: dict = TEMPLATES.defaults()
+    bodies = bodies or {}
+
+    def render(arg: str) -> str:
+        if arg.endswith(EXTENSION):
+            arg = arg.replace(EXTENSION, "")
+
+        name: str = arg
+        if "/" in name:
+            pieces = name.split("/")
+            name = pieces[len(pieces) - 1]
+
+        return template.render(name=name, guard=f"{name.upper()}_H",
+                               body=bodies.get(arg, ""), **defaults)
+
+    return render
+
+def scan_sources(names, output_dir: str = None) -> tuple:
+    """
+    Collect the declarations of C sources for their matching headers
+
+    Args:
+        names   (iterable): C sources or folders holding them
+        output_dir   (str): folder for the headers, next to the sources if None
+
+    Returns:
+        tuple: (header names without extension, header name -> body)
+    """
+    headers: dict = {}
+    for name in names:
+        if os.path.isdir(name):
+            sources: list = sorted(entry.path for entry in scan_tree(name, (".c",)))
+        else:
+            sources = [name]
+
+        for source in sources:
+            header: str = os.path.splitext(source)[0]
+            if output_dir is not None:
+                header = os.path.join(output_dir, os.path.basename(header))
+            headers[header] = source
+
+    cache = DeclarationCache()
+    try:
+        declarations: dict = cache.scan(list(headers.values()), workers=Config.JOBS)
+    except OSError as e:
+        print(f"htouch: {e}")
+        sys.exit(1)
+    cache.save()
+
+    bodies: dict = {}
+    for header, source in headers.items():
+        if declarations[source]:
+            bodies[header] = "\n".join(declarations[source]) + "\n\n"
+
+    return list(headers), bodies
+
+def audit_headers(roots: list, fix: bool = False) -> int:
+    """
+    Report (and optionally repair) the include guards of header trees
+
+    Guards are compared across every root, and --fix qualifies them
+    relative to the common parent of the roots so that headers with the
+    same name in different roots get different guards.
+
+    Args:
+        roots (list): folders to audit
+        fix   (bool): rewrite guards to the path qualified scheme
+
+    Returns:
+        int: The number of problems left unfixed
+    """
+    lines: list = []
+    problems: int = 0
+    missing: int = 0
+    rewritten: int = 0
+    headers: list = []
+    seen: set = set()
+
+    roots = list(roots)
+    for root in roots:
+        for path, guard in audit(root, workers=Config.JOBS):
+            # Overlapping roots list the same header twice
+            key: str = os.path.realpath(path)
+            if key not in seen:
+                seen.add(key)
+                headers.append((path, guard))
+
+    owners: dict = {}
+    for path, guard in headers:
+        if guard is None:
+            lines.append(f"  missing:   {path}\n")
+            problems += 1
+            missing += 1
+            continue
+
+        ifndef, define = guard
+        if not ifndef:
+            continue # #pragma once
+
+        if ifndef != define:
+            lines.append(f"  mismatch:  {path} (#ifndef {ifndef}, #define {define})\n")
+            problems += 1
+        owners.setdefault(ifndef, []).append(path)
+
+    for guard, paths in owners.items():
+        if len(paths) > 1:
+            lines.append(f"  duplicate: {guard} in {', '.join(paths)}\n")
+            problems += len(paths) - 1
+
+    if fix and headers:
+        base: str = os.path.commonpath([os.path.abspath(root) for root in roots])
+        expected: dict = {}
+        for path, guard in headers:
+            if guard and guard[0]:
+                expected.setdefault(guard_for(os.path.abspath(path), base), []).append((path, guard))
+
+        jobs: list = []
+        for new, found in expected.items():
+            # e.g. a-b.h and a_b.h, rewriting them would only make a new duplicate
+            if len(found) > 1:
+                lines.append(f"  collision: {new} for {', '.join(path for path, _ in found)}\n")
+                missing += len(found) - 1
+                continue
+
+            path, guard = found[0]
+            if not IDENTIFIER.fullmatch(new):
+                lines.append(f"  unfixable: {path} ({new} is not a valid macro name)\n")
+                missing += 1
+                continue
+
+            if guard != (new, new):
+                jobs.append((path, guard, new))
+
+        def repair(job: tuple) -> str:
+            try:
+                rewrite_guard(*job)
+            except OSError as e:
+                return str(e)
+            return None
+
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=max(1, Config.JOBS)) as pool:
+            errors: list = list(pool.map(repair, jobs, chunksize=64))
+
+        for (path, _, new), error in zip(jobs, errors):
+            if error is not None:
+                lines.append(f"  error:     {path}: {error}\n")
+                missing += 1
+                continue
+
+            rewritten += 1
+            if Config.VERBOSE:
+                lines.append(f"  rewrote:   {path} -> {new}\n")
+
+    lines.insert(0, f"htouch: {len(headers)} header(s) audited, {problems} problem(s)"
+                    f"{f', {rewritten} guard(s) rewritten' if fix else ''}.\n")
+    sys.stdout.write("".join(lines))
+
+    # Headers without any guard are left to be fixed by hand
+    return missing if fix else problems
+
+def usage():
+    print("Usage: htouch [option] FILE...")
+
+def help_menu():
+    usage()
+    print("""Generated a templated C Header file
+
+  -v, --verbose   Print more for debugging
+  -j, --jobs=N    create up to N files at once
+  -u, --update    only rewrite files whose contents would change
+  -s, --from-source
+                  treat FILE as C sources (or folders of them) and write
+                  their prototypes, structs, enums and #defines to the
+                  matching header
+  -o, --output-dir=DIR
+                  write headers generated with -s to DIR
+  -a, --audit     check the include guards of every header below FILE
+      --fix       with --audit, rewrite guards to path qualified names
+      --from-file=FILE
+                  read names from FILE, one per line ('-' for stdin)
+  -0, --null      names in FILE are separated by NUL instead of newline
+      --journal=FILE
+                  write the outcome of every file to FILE
+
+  -h, --help      display this help menu and exit
+  -V, --version   display version information and exit
+
+Report bugs to: <https://github.com/RileyMeta/py_scripts/pulls>""")
+
+def version_menu():
+    print(f"""htouch (Header Touch) 1.0.0
+Copyright (C) 2026 Riley Ava.
+License MPL2.0: Mozilla Public License 2.0 <https://www.mozilla.org/en-US/MPL/2.0/>.
+This is free software: you are free to change and redistribute it.
+There is NO WARRANTY, to the extent permitted by law.
+
+Written by Riley Ava.""")
+
+def main(argv: list = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    short_opts = "Vvj:0uso:a"
+    long_opts = ["help", "version", "verbose", "jobs=", "from-file=", "null",
+                 "journal=", "update", "from-source", "output-dir=",
+                 "audit", "fix"]
+
+    try:
+        opts, args = getopt.getopt(argv, short_opts, long_opts)
+    except getopt.GetoptError as e:
+        print(str(e))
+        sys.exit(2)
+
+    manifests: list = []
+    separator: bytes = b"\n"
+    from_source: bool = False
+    output_dir: str = None
+    audit_mode: bool = False
+    fix: bool = False
+
+    for opt, arg in opts:
+        if opt in ("--help"):
+            help_menu()
+            sys.exit(0)
+        elif opt in ("-V", "--version"):
+            version_menu()
+            sys.exit(0)
+        elif opt in ("-v", "--verbose"):
+            Config.VERBOSE = True
+        elif opt in ("-j", "--jobs"):
+            try:
+                Config.JOBS = int(arg)
+            except ValueError:
+                print(f"htouch: invalid number of jobs: {arg}")
+                sys.exit(2)
+        elif opt == "--from-file":
+            manifests.append(arg)
+        elif opt in ("-0", "--null"):
+            separator = b"\0"
+        elif opt in ("-u", "--update"):
+            Config.UPDATE = True
+        elif opt == "--journal":
+            Config.RESULTS.open(arg)
+        elif opt in ("-s", "--from-source"):
+            from_source = True
+        elif opt in ("-o", "--output-dir"):
+            output_dir = arg
+        elif opt in ("-a", "--audit"):
+            audit_mode = True
+        elif opt == "--fix":
+            fix = True
+
+    if not args and not manifests:
+        usage()
+        sys.exit(1)
+
+    if audit_mode:
+        roots = iter_names(args, manifests, separator)
+        return 1 if audit_headers(roots, fix) else 0
+
+    FM = FileMaker("htouch", EXTENSION)
+
+    bodies: dict = {}
+    names = iter_names(args, manifests, separator)
+
+    if from_source:
+        names, bodies = scan_sources(names, output_dir)
+    FM.create_files(names, workers=Config.JOBS, render=renderer(bodies))
+
+    FM.finish()
+
+    return 0
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+Makefile
+==============
+
+Brief description of the program.
+
+Full description of the program with technical information about the process.
+
+Author: Riley Ava
+Created: 20-01-2026
+Last Modified: 21-01-2026
+Version: 1.0.0
+License: MPL 2.0
+Repository: https://github.com/RileyMeta/py_scripts
+
+Requirements:
+    - Python 3.10 (or newer)
+
+Usage:
+    makefile [option] FILE...
+
+Copyright (c) 2026 Riley Ava
+"""
+import os, sys
+import getopt
+from backend import FileMaker, Config, iter_names, TEMPLATES, PROFILES
+
+def usage():
+    print("Usage: makefile [option] FILE...")
+
+def help_menu():
+    usage()
+    print("""Generated a templated Makefile
+
+  -v, --verbose   Print more for debugging
+  -p, --profile=NAME
+                  default build profile: debug, release (default), lto or pgo
+      --ccache    compile through ccache when it is installed
+      --unity=N   add a unity build target merging the sources into N files
+      --pch       build include/pch.h as a precompiled header for every source
+  -j, --jobs=N    create up to N files at once
+  -u, --update    only rewrite files whose contents would change
+      --from-file=FILE
+                  read names from FILE, one per line ('-' for stdin)
+  -0, --null      names in FILE are separated by NUL instead of newline
+      --journal=FILE
+                  write the outcome of every file to FILE
+
+  -h, --help      display this help menu and exit
+  -V, --version   display version information and exit
+
+Report bugs to: <https://github.com/RileyMeta/py_scripts/pulls>""")
+
+def version_menu():
+    print(f"""makefile (makefile Touch) 1.0.0
+Copyright (C) 2026 Riley Ava.
+License MPL2.0: Mozilla Public License 2.0 <https://www.mozilla.org/en-US/MPL/2.0/>.
+This is free software: you are free to change and redistribute it.
+There is NO WARRANTY, to the extent permitted by law.
+
+Written by Riley Ava.""")
+
+def main(argv: list = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    short_opts = "Vvj:0up:"
+    long_opts = ["help", "version", "verbose", "jobs=", "from-file=", "null",
+                 "journal=", "update", "profile=", "ccache", "unity=",
+                 "pch"]
+
+    try:
+        opts, args = getopt.getopt(argv, short_opts, long_opts)
+    except getopt.GetoptError as e:
+        print(str(e))
+        sys.exit(2)
+
+    manifests: list = []
+    profile: str = "release"
+    ccache: int = 0
+    unity: int = 0
+    pch: int = 0
+    separator: bytes = b"\n"
+
+    for opt, arg in opts:
+        if opt in ("--help"):
+            help_menu()
+            sys.exit(0)
+        elif opt in ("-V", "--version"):
+            version_menu()
+            sys.exit(0)
+        elif opt in ("-v", "--verbose"):
+            Config.VERBOSE = True
+        elif opt in ("-j", "--jobs"):
+            try:
+                Config.JOBS = int(arg)
+            except ValueError:
+                print(f"makefile: invalid number of jobs: {arg}")
+                sys.exit(2)
+        elif opt == "--from-file":
+            manifests.append(arg)
+        elif opt in ("-0", "--null"):
+            separator = b"\0"
+        elif opt in ("-u", "--update"):
+            Config.UPDATE = True
+        elif opt == "--journal":
+            Config.RESULTS.open(arg)
+        elif opt in ("-p", "--profile"):
+            if arg not in PROFILES:
+                print(f"makefile: invalid profile: {arg}")
+                sys.exit(2)
+            profile = arg
+        elif opt == "--ccache":
+            ccache = 1
+        elif opt == "--unity":
+            try:
+                unity = int(arg)
+                if unity < 0:
+                    raise ValueError(arg)
+            except ValueError:
+                print(f"makefile: invalid number of unity files: {arg}")
+                sys.exit(2)
+        elif opt == "--pch":
+            pch = 1
+
+    if not args and not manifests:
+        usage()
+        sys.exit(1)
+
+    FM = FileMaker("makefile", "")
+
+    template = TEMPLATES.get("makefile")
+    defaults: dict = TEMPLATES.defaults()
+
+    def render(filename: str) -> str:
+        arg: str = filename.removesuffix("/Makefile")
+        name: str = arg
+
+        if "/" in name:
+            skip: int = 1
+            if name.endswith("/"):
+                skip += 1
+            pieces = name.split("/")
+            name = pieces[len(pieces) - skip]
+
+        return template.render(name=name, profile=profile, ccache=ccache,
+                               unity=unity, pch=pch, **defaults)
+
+    names = iter_names(args, manifests, separator)
+    FM.create_files((f"{arg}/Makefile" for arg in names),
+                    workers=Config.JOBS, render=render)
+
+    FM.finish()
+
+    return 0
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+Pytouch
+==============
+
+Touch a python file into existence.
+
+Generate a templated python file or files based on a list of names.
+
+Author: Riley Ava
+Created: 20-01-2026
+Last Modified: 20-01-2026
+Version: 1.0.0
+License: MPL 2.0
+Repository: https://github.com/RileyMeta/py_scripts
+
+Requirements:
+    - Python 3.10 (or newer)
+
+Usage:
+    pytouch [option] FILE...
+
+Copyright (c) 2026 Riley Ava
+"""
+import os, sys
+import getopt
+from backend import FileMaker, Config, iter_names, TEMPLATES
+
+EXTENSION: str = ".py"
+
+# Marks the __init__.py files pytouch may regenerate without asking
+PACKAGE_MARKER: str = "# Lazy submodule loading generated by pytouch"
+
+class PackageMaker(FileMaker):
+    def confirm_overwrite(self, filename: str) -> bool:
+        try:
+            with open(self.target(str(filename)), 'r') as f:
+                if PACKAGE_MARKER in f.read(4096):
+                    return True
+        except OSError:
+            pass
+
+        return super().confirm_overwrite(filename)
+
+def renderer():
+    """
+    Returns:
+        callable: Renders the contents of a new module from its name
+    """
+    template = TEMPLATES.get("py")
+    defaults: dict = TEMPLATES.defaults()
+
+    def render(arg: str) -> str:
+        name: str = arg
+        if arg.endswith(EXTENSION):
+            name = name.replace(EXTENSION, "")
+
+        if "/" in name:
+            pieces = name.split("/")
+            name = pieces[len(pieces) - 1]
+
+        return template.render(name=name, **defaults)
+
+    return render
+
+def package_modules(package: str, names, packages: set):
+    """
+    Turn module names into paths inside a package, creating its folders
+
+    Args:
+        package      (str): root folder of the package
+        names   (iterable): module names, like "mod" or "sub/mod" or "sub.mod"
+        packages     (set): filled with every package folder that is used
+
+    Yields:
+        str: The path of every module, without extension
+    """
+    packages.add(package)
+    os.makedirs(package, exist_ok=True)
+
+    for name in names:
+        name = name.removesuffix(".py").replace(".", "/")
+        module: str = os.path.join(package, name)
+        folder: str = os.path.dirname(module)
+
+        while folder not in packages and folder != package:
+            os.makedirs(folder, exist_ok=True)
+            packages.add(folder)
+            folder = os.path.dirname(folder)
+
+        yield module
+
+def submodules(folder: str, packages: set) -> list:
+    """
+    Args:
+        folder   (str): a package folder
+        packages (set): package folders created in this run
+
+    Returns:
+        list: The sorted names of the modules and packages inside it
+    """
+    names: list = []
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                if entry.path in packages or os.path.exists(os.path.join(entry.path, "__init__.py")):
+                    names.append(entry.name)
+            elif entry.name.endswith(".py") and entry.name != "__init__.py":
+                names.append(entry.name.removesuffix(".py"))
+
+    return sorted(names)
+
+def usage():
+    print("Usage: pytouch [option] FILE...")
+
+def help_menu():
+    usage()
+    print("""Generated a templated Python file
+
+  -v, --verbose   Print more for debugging
+  -j, --jobs=N    create up to N files at once
+  -u, --update    only rewrite files whose contents would change
+      --package=NAME
+                  create FILE as modules of the package NAME, with
+                  __init__.py files that import submodules lazily
+      --from-file=FILE
+                  read names from FILE, one per line ('-' for stdin)
+  -0, --null      names in FILE are separated by NUL instead of newline
+      --journal=FILE
+                  write the outcome of every file to FILE
+
+  -h, --help      display this help menu and exit
+  -V, --version   display version information and exit
+
+Report bugs to: <https://github.com/RileyMeta/py_scripts/pulls>""")
+
+def version_menu():
+    print(f"""pytouch (python Touch) 1.0.0
+Copyright (C) 2026 Riley Ava.
+License MPL2.0: Mozilla Public License 2.0 <https://www.mozilla.org/en-US/MPL/2.0/>.
+This is free software: you are free to change and redistribute it.
+There is NO WARRANTY, to the extent permitted by law.
+
+Written by Riley Ava.""")
+
+def main(argv: list = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    short_opts = "Vvj:0u"
+    long_opts = ["help", "version", "verbose", "jobs=", "from-file=", "null",
+                 "journal=", "update", "package="]
+
+    try:
+        opts, args = getopt.getopt(argv, short_opts, long_opts)
+    except getopt.GetoptError as e:
+        print(str(e))
+        sys.exit(2)
+
+    manifests: list = []
+    separator: bytes = b"\n"
+    package: str = ""
+
+    for opt, arg in opts:
+        if opt in ("--help"):
+            help_menu()
+            sys.exit(0)
+        elif opt in ("-V", "--version"):
+            version_menu()
+            sys.exit(0)
+        elif opt in ("-v", "--verbose"):
+            Config.VERBOSE = True
+        elif opt in ("-j", "--jobs"):
+            try:
+                Config.JOBS = int(arg)
+            except ValueError:
+                print(f"pytouch: invalid number of jobs: {arg}")
+                sys.exit(2)
+        elif opt == "--from-file":
+            manifests.append(arg)
+        elif opt in ("-0", "--null"):
+            separator = b"\0"
+        elif opt in ("-u", "--update"):
+            Config.UPDATE = True
+        elif opt == "--journal":
+            Config.RESULTS.open(arg)
+        elif opt == "--package":
+            package = os.path.normpath(arg)
+
+    if not args and not manifests and not package:
+        usage()
+        sys.exit(1)
+
+    extension: str = EXTENSION
+    FM = FileMaker("pytouch", extension)
+    defaults: dict = TEMPLATES.defaults()
+
+    names = iter_names(args, manifests, separator)
+
+    packages: set = set()
+    if package:
+        names = package_modules(package, names, packages)
+
+    FM.create_files(names, workers=Config.JOBS, render=renderer())
+
+    if package:
+        init_template = TEMPLATES.get("package")
+
+        def render_init(init: str) -> str:
+            folder: str = os.path.dirname(init)
+            modules: str = ", ".join(f'"{name}"' for name in submodules(folder, packages))
+            dotted: str = os.path.relpath(folder, os.path.dirname(package)).replace(os.sep, ".")
+            return init_template.render(name=dotted, modules=modules, **defaults)
+
+        PM = PackageMaker("pytouch", extension)
+        PM.index = FM.index
+        inits: list = [os.path.join(folder, "__init__") for folder in sorted(packages)]
+        PM.create_files(inits, workers=Config.JOBS, render=render_init)
+
+    FM.finish()
+
+    return 0
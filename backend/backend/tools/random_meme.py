@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+"""
+random_meme
+==============
+
+Play a random meme from a directory
+
+Pull all .mp4 files from a directory and add them to a list to
+be randomly played when the programm is called.
+
+Author: Riley Ava
+Created: 21/01/2026
+Last Modified: 26/01/2026
+Version: 1.1.0
+License: MPL 2.0
+Repository: https://github.com/RileyMeta/random_meme
+
+Requirements:
+    - Python 3.10 (or newer)
+
+Usage:
+    random_meme [option] <directory>
+
+Copyright (c) 2026 Riley Ava
+"""
+import os
+import sys
+import getopt
+from time import perf_counter
+from backend import MediaIndex, which, cache_dir
+from backend.mediaindex import WEIGHTS
+
+class Config:
+    REPLAY: bool = False
+    SHUFFLE: bool = False
+    WEIGHT: str = ""
+    PLAYER: str = ""
+    PLAYER_PATH: str = ""
+    VERBOSE: bool = False
+    PLAYERS: list = ["vlc", "mpv", "smplayer", "mplayer"]
+    EXTENSIONS: tuple = (".mp4", ".mov")
+    RECURSIVE: bool = False
+    JOBS: int = 8
+
+class RandomMeme:
+    def __init__(self, directories: list):
+        self.directories: list = directories
+        self.index: MediaIndex = MediaIndex()
+        self.libraries: list = []
+        self.video_played: str = ""
+        self.tmp_file: str = "/tmp/meme"
+        self.last_video: str = ""
+        self.timings: dict = {}
+        self.player_cache: str = cache_dir("player.json")
+
+        # An explicit --player is used as given, nothing is looked up
+        if not Config.PLAYER:
+            self.timed("detect", self.check_players)
+        self.get_last()
+        self.timed("index", self.populate_list)
+
+    def timed(self, phase: str, func, *args):
+        """
+        Run one step before the video starts and keep its time
+
+        Args:
+            phase    (str): name of the step
+            func (callable): the step itself
+        """
+        start: float = perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self.timings[phase] = self.timings.get(phase, 0.0) + perf_counter() - start
+
+    def cached_player(self) -> tuple:
+        """
+        Get the player found by a previous run
+
+        The entry is only trusted while PATH, the list of players and the
+        mtime of the player's binary are all unchanged.
+
+        Returns:
+            tuple: (player, path of its binary), None if the cache is stale
+        """
+        import json
+        try:
+            with open(self.player_cache, 'r') as f:
+                cached: dict = json.load(f)
+
+            if (cached["PATH"] == os.environ.get("PATH", os.defpath)
+                    and cached["players"] == Config.PLAYERS
+                    and os.stat(cached["path"]).st_mtime_ns == cached["mtime_ns"]):
+                return cached["player"], cached["path"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        return None
+
+    def cache_player(self):
+        import json
+        try:
+            os.makedirs(os.path.dirname(self.player_cache), exist_ok=True)
+            cached: dict = {"PATH": os.environ.get("PATH", os.defpath),
+                            "players": Config.PLAYERS,
+                            "player": Config.PLAYER,
+                            "path": Config.PLAYER_PATH,
+                            "mtime_ns": os.stat(Config.PLAYER_PATH).st_mtime_ns}
+            with open(self.player_cache, 'w') as f:
+                json.dump(cached, f)
+        except OSError as err:
+            print(f"Error [cache_player]: {err}")
+
+    def check_players(self):
+        cached: tuple = self.cached_player()
+        if cached is not None:
+            Config.PLAYER, Config.PLAYER_PATH = cached
+            return None
+
+        for player in Config.PLAYERS:
+            path: str = which(player)
+            if path is not None:
+                Config.PLAYER = player
+                Config.PLAYER_PATH = path
+                self.cache_player()
+                break
+
+        if not Config.PLAYER or Config.PLAYER == "":
+            print(f"No suitable video player was found...")
+            last: int = (len(Config.PLAYERS) - 1)
+
+            for a, player in enumerate(Config.PLAYERS):
+                end: str = ", " if a != last else "\n"
+                print(f"{player}{end}", end="")
+
+            sys.exit(-1)
+
+    def folder_exists(self, directory: str) -> bool:
+        folder_dir: str = os.path.realpath(os.path.expanduser(directory))
+
+        if os.path.exists(folder_dir):
+            return True
+        return False
+
+    def populate_list(self):
+        for directory in self.directories:
+            if not self.folder_exists(directory):
+                print(f"{directory} folder does not exist.")
+                sys.exit(-1)
+
+            try:
+                self.libraries.append(self.index.library(directory, Config.EXTENSIONS,
+                                                         Config.RECURSIVE, Config.JOBS))
+            except OSError as err:
+                print(f"Error [populate_list]: {err}")
+                sys.exit(-1)
+
+    def cache_video(self):
+        path: str = str(self.tmp_file)
+
+        if not self.video_played:
+            return None
+
+        try:
+            with open(path, 'w') as f:
+                f.write(str(self.video_played))
+
+        except Exception as err:
+            print(f"Error [cache_video]: {err}")
+
+    def get_last(self):
+        path: str = str(self.tmp_file)
+
+        try:
+            with open(path, 'r') as f:
+                self.last_video = f.readline()
+
+        except FileNotFoundError:
+            self.last_video = ""
+
+        except Exception as err:
+            print(f"Error [get_last]: {err}")
+
+    def play_random_video(self):
+        picked: tuple = None
+
+        if not Config.REPLAY:
+            if Config.WEIGHT:
+                picked = self.timed("pick", self.index.weighted, self.libraries, Config.WEIGHT)
+            elif Config.SHUFFLE:
+                picked = self.timed("pick", self.index.shuffled, self.libraries)
+            else:
+                picked = self.timed("pick", self.index.pick, self.libraries)
+
+            if picked is None:
+                print(f"No videos were found in {', '.join(self.directories)}.")
+                sys.exit(-1)
+            self.video_played = self.index.entry(*picked)
+        else:
+            self.video_played = self.last_video
+        self.timed("launch", self.play_video, self.video_played)
+
+        if picked is not None:
+            self.index.played(*picked)
+
+        vid_path: str = os.path.realpath(os.path.expanduser(self.video_played))
+        self.cache_video()
+
+        print(f"Video Played: {vid_path}")
+
+    def play_video(self, video: str):
+        video_player: str = Config.PLAYER_PATH or Config.PLAYER
+        import subprocess
+        try:
+            subprocess.Popen([video_player, video],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL)
+        except OSError as err:
+            print(f"Error [play_video]: could not start {Config.PLAYER}: {err}")
+            sys.exit(-1)
+
+    def report(self, start: float):
+        """
+        Print how long each step took before the video started
+
+        Args:
+            start (float): perf_counter() when the program started
+        """
+        total: float = perf_counter() - start
+        lines: list = [f"  {phase:<10}{seconds * 1000:10.2f} ms\n"
+                       for phase, seconds in self.timings.items()]
+        lines.append(f"  {'total':<10}{total * 1000:10.2f} ms\n")
+        sys.stdout.write(f"random_meme: started {Config.PLAYER} after\n" + "".join(lines))
+
+def usage():
+    print("Usage: random_meme [option] [DIRECTORY]...")
+
+def help_menu():
+    usage()
+    print("""Play a random meme from one or more folders.
+
+  -p, --player   specify a video player (default: VLC)
+  -r, --replay   replay the most recent video
+  -s, --shuffle  go through every video once, in random order, before
+                 any of them plays again
+  -w, --weight=MODE
+                 favour some videos: age (newer first), size (bigger
+                 first) or plays (played less first)
+  -R, --recursive
+                 also look for videos in subfolders
+  -e, --extensions=LIST
+                 comma separated video extensions (default: mp4,mov)
+  -j, --jobs=N   read up to N folders at once while scanning (default: 8)
+
+  -v, --verbose  report how long it took to start the video
+
+      --help     display this help information and exit
+  -V, --version  display version information and exit
+
+Report bugs to: <https://github.com/RileyMeta/random_meme/pulls>""")
+
+def version_menu():
+    print("""random_meme (random meme player) 1.1.0
+Copyright (C) 2026 Riley Ava.
+License MPL2.0: Mozilla Public License 2.0 <https://www.mozilla.org/en-US/MPL/2.0/>.
+This is free software: you are free to change and redistribute it.
+There is NO WARRANTY, to the extent permitted by law.
+
+Written by Riley Ava.""")
+
+def main(argv: list = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    start: float = perf_counter()
+
+    # Default meme folder path
+    meme_dirs: list = [os.path.expanduser("~/Videos/memes")]
+
+    try:
+        short_opts: str = "Vvrsw:p:Re:j:"
+        long_opts: list = ["version", "help", "verbose", "replay", "shuffle", "weight=",
+                           "player=", "recursive", "extensions=", "jobs="]
+
+        opts, args = getopt.getopt(argv, short_opts, long_opts)
+
+    except getopt.GetoptError as err:
+        print(f"{err}")
+        usage()
+        sys.exit(2)
+
+    for opt, arg in opts:
+        if opt in ("--help"):
+            help_menu()
+            sys.exit(0)
+        elif opt in ("-V", "--version"):
+            version_menu()
+            sys.exit(0)
+        elif opt in ("-v", "--verbose"):
+            Config.VERBOSE = True
+        elif opt in ("-p", "--player"):
+            Config.PLAYER = arg
+        elif opt in ("-r", "--replay"):
+            Config.REPLAY = True
+        elif opt in ("-s", "--shuffle"):
+            Config.SHUFFLE = True
+        elif opt in ("-w", "--weight"):
+            if arg not in WEIGHTS:
+                print(f"random_meme: invalid weight '{arg}', use {', '.join(WEIGHTS)}")
+                sys.exit(2)
+            Config.WEIGHT = arg
+        elif opt in ("-R", "--recursive"):
+            Config.RECURSIVE = True
+        elif opt in ("-e", "--extensions"):
+            Config.EXTENSIONS = tuple(f".{ext.strip().lstrip('.')}"
+                                      for ext in arg.split(",") if ext.strip())
+            if not Config.EXTENSIONS:
+                print(f"random_meme: no extensions given: '{arg}'")
+                sys.exit(2)
+        elif opt in ("-j", "--jobs"):
+            try:
+                Config.JOBS = int(arg)
+            except ValueError:
+                print(f"random_meme: invalid number of jobs: {arg}")
+                sys.exit(2)
+
+    if Config.SHUFFLE and Config.WEIGHT:
+        print("random_meme: --shuffle and --weight can't be used together")
+        sys.exit(2)
+
+    if args:
+        meme_dirs = args
+
+    RM = RandomMeme(meme_dirs)
+    RM.play_random_video()
+
+    if Config.VERBOSE:
+        RM.report(start)
+
+    return 0
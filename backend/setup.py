@@ -6,4 +6,15 @@ setup(
     packages=find_packages(),
     python_requires=">=3.10",
     install_requires=[],
+    entry_points={
+        "console_scripts": [
+            "py_scripts=backend.cli:main",
+            "cproject=backend.cli:main",
+            "ctouch=backend.cli:main",
+            "htouch=backend.cli:main",
+            "makefile=backend.cli:main",
+            "pytouch=backend.cli:main",
+            "random_meme=backend.cli:main",
+        ],
+    },
 )
@@ -22,68 +22,8 @@ Usage:
 
 Copyright (c) 2026 Riley Ava
 """
-import os, sys
-import getopt
-from backend import FileMaker, Config
-
-def usage():
-    print("Usage: ctouch [option] FILE...")
-
-def help_menu():
-    usage()
-    print("""Generated a templated C file
-
-  -v, --verbose   Print more for debugging
-
-  -h, --help      display this help menu and exit
-  -V, --version   display version information and exit
-
-Report bugs to: <https://github.com/RileyMeta/py_scripts/pulls>""")
-
-def version_menu():
-    print(f"""ctouch (C Touch) 1.0.0
-Copyright (C) 2026 Riley Ava.
-License MPL2.0: Mozilla Public License 2.0 <https://www.mozilla.org/en-US/MPL/2.0/>.
-This is free software: you are free to change and redistribute it.
-There is NO WARRANTY, to the extent permitted by law.
-
-Written by Riley Ava.""")
+import sys
+from backend.cli import run
 
 if __name__ == "__main__":
-    short_opts = "Vv"
-    long_opts = ["help", "version", "verbose"]
-
-    try:
-        opts, args = getopt.getopt(sys.argv[1:], short_opts, long_opts)
-    except getopt.GetoptError as e:
-        print(str(e))
-        sys.exit(2)
-
-    for opt, arg in opts:
-        if opt in ("--help"):
-            help_menu()
-            sys.exit(0)
-        elif opt in ("-V", "--version"):
-            version_menu()
-            sys.exit(0)
-        elif opt in ("-v", "--verbose"):
-            Config.VERBOSE = True
-
-    if not args:
-        usage()
-        sys.exit(1)
-
-    FM = FileMaker("ctouch", ".c")
-
-    FM.file_template = """#include <stdio.h>
-
-int main(int argc, char *argv[]) {
-    printf("Hello, World!\\n");
-
-    return 0;
-}"""
-
-    for arg in args:
-        FM.create_file(arg)
-
-    FM.finish()
+    sys.exit(run("ctouch", sys.argv[1:]))